@@ -1,22 +1,21 @@
 #!/usr/bin/env python
 """
 Simple test runner to validate unit tests without pytest plugin issues.
+
+All unit suites run in a single in-process pytest session, so the interpreter
+and pytest startup cost is paid once.
 """
 import sys
 sys.path.insert(0, 'src')
 
-# Import test modules
-from tests.unittests import test_test_args
-from tests.unittests import test_parameters
-
 # Import pytest
 import pytest
 
 if __name__ == "__main__":
     # Run tests with minimal plugins
     exit_code = pytest.main([
-        'tests/unittests/test_test_args.py',
-        'tests/unittests/test_parameters.py',
+        'tests/unittests',
+        'tests/test_rng.py',
         '-v',
         '-p', 'no:cacheprovider',
         '--override-ini=addopts=',  # Clear addopts
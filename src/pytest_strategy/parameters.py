@@ -1,9 +1,88 @@
 # parameter.py
 
-from typing import Callable, Any
+import ast
+import inspect
+import itertools
+from typing import Callable, Any, Iterator
+from .rng import _instance_attributes
 from .test_args import TestArg
 
 
+def _ordering_pair(constraint: Callable) -> tuple[int, int] | None:
+    """
+    Recognize a ``lambda v: v[i] < v[j]`` (or ``>``) vector constraint.
+
+    The lambda's source is parsed with ast and matched against the pattern;
+    the parsed lambda is compiled back and compared with the constraint's own
+    bytecode so that another lambda on the same source line is never mistaken
+    for it.
+
+    Args:
+        constraint: Vector constraint function
+
+    Returns:
+        (i, j) such that the constraint holds exactly when v[i] < v[j],
+        or None if the constraint is not of that form
+    """
+    code = getattr(constraint, "__code__", None)
+    if code is None or constraint.__name__ != "<lambda>" or code.co_argcount != 1:
+        return None
+    try:
+        source = inspect.getsource(constraint)
+    except (OSError, TypeError):
+        return None
+
+    start = source.find("lambda")
+    while start != -1:
+        # Try the longest expression first, cutting only where one could end
+        for end in range(len(source), start, -1):
+            if end < len(source) and source[end] not in ",)]}\n":
+                continue
+            try:
+                tree = ast.parse(source[start:end], mode="eval")
+            except SyntaxError:
+                continue
+            if not isinstance(tree.body, ast.Lambda):
+                continue
+            compiled = compile(tree, "<constraint>", "eval")
+            lambda_code = next(c for c in compiled.co_consts if inspect.iscode(c))
+            if (lambda_code.co_code, lambda_code.co_consts) == (code.co_code, code.co_consts):
+                return _match_ordering(tree.body)
+            break
+        start = source.find("lambda", start + 1)
+    return None
+
+
+def _match_ordering(node: ast.Lambda) -> tuple[int, int] | None:
+    """Match ``v[i] < v[j]`` / ``v[i] > v[j]`` with literal indices in a lambda."""
+    args = node.args
+    if len(args.args) != 1 or args.posonlyargs or args.vararg or args.kwonlyargs:
+        return None
+    name = args.args[0].arg
+
+    body = node.body
+    if not (isinstance(body, ast.Compare) and len(body.ops) == 1):
+        return None
+
+    indices = []
+    for side in (body.left, body.comparators[0]):
+        if not (isinstance(side, ast.Subscript)
+                and isinstance(side.value, ast.Name) and side.value.id == name
+                and isinstance(side.slice, ast.Constant)
+                and type(side.slice.value) is int and side.slice.value >= 0):
+            return None
+        indices.append(side.slice.value)
+
+    i, j = indices
+    if i == j:
+        return None
+    if isinstance(body.ops[0], ast.Lt):
+        return i, j
+    if isinstance(body.ops[0], ast.Gt):
+        return j, i
+    return None
+
+
 class Parameter:
     """
     Manages a collection of TestArg instances and generates parameter vectors.
@@ -15,6 +94,29 @@ class Parameter:
     - CLI-based filtering
     """
 
+    __slots__ = (
+        'test_args',
+        'directed_vectors',
+        'always_include_directed',
+        'vector_constraints',
+        'max_retries',
+        '_arg_names',
+        '_arg_types',
+        '_arg_by_name',
+        '_gen_vector',
+        '_fused_constraints',
+        '_orderings',
+    )
+
+    # Sampling mode -> (include directed vectors, draw n random vectors);
+    # None follows always_include_directed
+    _MODES = {
+        "all": (True, True),
+        "random_only": (False, True),
+        "directed_only": (True, False),
+        "mixed": (None, True),
+    }
+
     def __init__(
         self,
         *test_args: TestArg,
@@ -31,6 +133,7 @@ class Parameter:
             directed_vectors: Dictionary mapping vector names to value tuples
             always_include_directed: If True, directed vectors are included in "mixed" mode
             vector_constraints: List of functions that validate entire parameter vectors
+            max_retries: Maximum attempts to draw vectors satisfying the constraints
 
         Raises:
             ValueError: If directed vectors don't match the number of test args
@@ -56,6 +159,22 @@ class Parameter:
         self.directed_vectors = directed_vectors or {}
         self.always_include_directed = always_include_directed
         self.vector_constraints = vector_constraints or []
+        self.max_retries = max_retries
+
+        # Introspection caches; test_args is fixed after construction
+        self._arg_names = tuple(arg.name for arg in self.test_args)
+        self._arg_types = tuple(arg.type for arg in self.test_args)
+        # Reversed so the first argument wins on duplicate names, as in a scan
+        self._arg_by_name = {arg.name: arg for arg in reversed(self.test_args)}
+
+        # Unrolled vector generator for this Parameter's arity
+        self._gen_vector = self._compile_vector_generator()
+
+        # (constraints, fused check) pair, rebuilt when the constraint list changes
+        self._fused_constraints = None
+
+        # (constraints, ordering pairs) pair, rebuilt when the constraint list changes
+        self._orderings = None
 
         # Validate directed vectors on initialization
         self._validate_directed_vectors()
@@ -65,15 +184,20 @@ class Parameter:
         Ensure all directed vectors match the number of test args.
 
         Raises:
-            ValueError: If any directed vector has wrong number of values
+            ValueError: If any directed vector has wrong number of values; the
+                message lists every offending vector
         """
+        if not self.directed_vectors:
+            return
+
         expected_len = len(self.test_args)
-        for name, vector in self.directed_vectors.items():
-            if len(vector) != expected_len:
-                raise ValueError(
-                    f"Directed vector '{name}' has {len(vector)} values, "
-                    f"expected {expected_len}"
-                )
+        bad = [
+            f"Directed vector '{name}' has {len(vector)} values"
+            for name, vector in self.directed_vectors.items()
+            if len(vector) != expected_len
+        ]
+        if bad:
+            raise ValueError(f"{'; '.join(bad)}, expected {expected_len}")
 
     def _validate_vector(self, vector: tuple) -> bool:
         """
@@ -85,10 +209,102 @@ class Parameter:
         Returns:
             True if all constraints pass, False otherwise
         """
-        for constraint in self.vector_constraints:
-            if not constraint(vector):
-                return False
-        return True
+        return self._fused_constraint()(vector)
+
+    def _fused_constraint(self) -> Callable[[tuple], bool]:
+        """
+        Get a single function that checks every vector constraint.
+
+        The function is generated once per constraint set as straight-line code
+        (``c0(v) and c1(v) and ...``) with the constraints bound as locals, so a
+        vector is checked with one call instead of a loop over the list.
+
+        Returns:
+            Function taking a vector and returning True if all constraints pass
+        """
+        constraints = tuple(self.vector_constraints)
+        if self._fused_constraints is not None and self._fused_constraints[0] == constraints:
+            return self._fused_constraints[1]
+
+        names = [f"_c{i}" for i in range(len(constraints))]
+        body = " and ".join(f"{n}(v)" for n in names) or "True"
+        defaults = "".join(f", {n}={n}" for n in names)
+        namespace = dict(zip(names, constraints))
+        exec(f"def _fused(v{defaults}):\n    return bool({body})", namespace)
+
+        fused = namespace["_fused"]
+        self._fused_constraints = (constraints, fused)
+        return fused
+
+    def _ordering_pairs(self) -> tuple[tuple[int, int], ...]:
+        """
+        Get the ordering constraints that can be met by swapping values.
+
+        A ``lambda v: v[i] < v[j]`` constraint rejects about half of all draws
+        when both arguments come from the same distribution. Swapping v[i] and
+        v[j] whenever they are out of order yields the same distribution as
+        rejecting, without the wasted draw. Only pairs of interchangeable
+        arguments qualify, and no argument may appear in two pairs, since
+        chained swaps would bias the result. Every constraint is still checked
+        afterwards, which catches ties.
+
+        Returns:
+            Tuple of (i, j) index pairs to put in ascending order
+        """
+        constraints = tuple(self.vector_constraints)
+        if self._orderings is not None and self._orderings[0] == constraints:
+            return self._orderings[1]
+
+        pairs = []
+        used = set()
+        for constraint in constraints:
+            pair = _ordering_pair(constraint)
+            if pair is None or used.intersection(pair) or not self._interchangeable(*pair):
+                continue
+            used.update(pair)
+            pairs.append(pair)
+
+        self._orderings = (constraints, tuple(pairs))
+        return self._orderings[1]
+
+    def _interchangeable(self, i: int, j: int) -> bool:
+        """Check whether args i and j draw from identically configured RNG types."""
+        if max(i, j) >= len(self.test_args):
+            return False
+        a, b = self.test_args[i], self.test_args[j]
+        if a.is_static or b.is_static or a.rng_type is None or b.rng_type is None:
+            return False
+        if type(a.rng_type) is not type(b.rng_type) or a._validator is not b._validator:
+            return False
+        return _instance_attributes(a.rng_type) == _instance_attributes(b.rng_type)
+
+    @staticmethod
+    def _order_vector(vector: tuple, pairs: tuple[tuple[int, int], ...]) -> tuple:
+        """Swap the values of each (i, j) pair that is out of ascending order."""
+        values = list(vector)
+        for i, j in pairs:
+            if values[j] < values[i]:
+                values[i], values[j] = values[j], values[i]
+        return tuple(values)
+
+    def _compile_vector_generator(self) -> Callable[[], tuple]:
+        """
+        Build a function that draws one vector from the test args.
+
+        The function is generated for this Parameter's arity as a literal tuple
+        (``(a0(), a1(), ...)``) with each TestArg's specialized generate
+        function bound as a local, so a draw avoids the generator-expression
+        protocol and the generate() method call.
+
+        Returns:
+            Zero-argument function returning a new parameter vector
+        """
+        names = [f"_a{i}" for i in range(len(self.test_args))]
+        body = "".join(f"{n}(), " for n in names)
+        params = ", ".join(f"{n}={n}" for n in names)
+        namespace = {n: arg._generate for n, arg in zip(names, self.test_args)}
+        exec(f"def _gen({params}):\n    return ({body})", namespace)
+        return namespace["_gen"]
 
     # ====
     # Vector Management
@@ -162,13 +378,20 @@ class Parameter:
         Example:
             vector = param.generate_vector()  # e.g., (5, 3.14, "fast")
         """
-        max_retries = 100
+        if not self.vector_constraints:
+            return self._gen_vector()
+
+        max_retries = self.max_retries
+        check = self._fused_constraint()
+        pairs = self._ordering_pairs()
 
         for _ in range(max_retries):
-            vector = tuple(arg.generate() for arg in self.test_args)
+            vector = self._gen_vector()
+            if pairs:
+                vector = self._order_vector(vector, pairs)
 
             # Check constraints
-            if self._validate_vector(vector):
+            if check(vector):
                 return vector
 
         raise ValueError(
@@ -196,7 +419,9 @@ class Parameter:
         mode: str = "all",
         filter_by_name: str | None = None,
         filter_by_index: int | None = None,
-    ) -> list[tuple]:
+        dedupe: bool = False,
+        lazy: bool = False,
+    ) -> list[tuple] | Iterator[tuple]:
         """
         Generate parameter vectors.
 
@@ -209,9 +434,17 @@ class Parameter:
                 - "mixed": Directed (if always_include_directed=True) + n random
             filter_by_name: Only return this directed vector (for -vn CLI)
             filter_by_index: Only return directed vector at index (for -vi CLI)
+            dedupe: If True, skip random draws equal to a directed vector or an
+                earlier draw. Duplicates are redrawn up to max_retries rounds, so
+                fewer than n random vectors are returned when the value space
+                is too small. Vectors must be hashable.
+            lazy: If True, return an iterator that yields the directed vectors
+                straight from the dict and draws random vectors one at a time
+                as they are consumed, instead of building a list. Meant for
+                direct callers; Strategy always needs the full list
 
         Returns:
-            List of parameter vectors (tuples)
+            List of parameter vectors (tuples), or an iterator if lazy is True
 
         Examples:
             # All directed + 10 random
@@ -229,8 +462,6 @@ class Parameter:
             # Get specific vector by index
             samples = param.generate_samples(0, filter_by_index=0)
         """
-        samples = []
-
         # Handle CLI filters first (override mode)
         if filter_by_name:
             return [self.get_vector_by_name(filter_by_name)]
@@ -238,34 +469,184 @@ class Parameter:
         if filter_by_index is not None:
             return [self.get_vector_by_index(filter_by_index)]
 
-        # Validate mode
-        valid_modes = ["all", "random_only", "directed_only", "mixed"]
-        if mode not in valid_modes:
-            raise ValueError(f"Invalid mode '{mode}'. Must be one of {valid_modes}")
+        # Validate mode and look up its behaviour in one step
+        try:
+            include_directed, draw_random = self._MODES[mode]
+        except KeyError:
+            raise ValueError(
+                f"Invalid mode '{mode}'. Must be one of {list(self._MODES)}"
+            ) from None
 
-        # Mode: directed_only
-        if mode == "directed_only":
+        # directed_vectors is a public dict, so it is read on every call
+        if not draw_random:
+            if lazy:
+                return iter(self.directed_vectors.values())
             return list(self.directed_vectors.values())
 
-        # Mode: all - always include all directed vectors
-        if mode == "all":
-            samples.extend(self.directed_vectors.values())
+        if include_directed is None:
+            include_directed = self.always_include_directed
+        directed = self.directed_vectors.values() if include_directed else ()
 
-        # Mode: mixed - respect always_include_directed flag
-        elif mode == "mixed":
-            if self.always_include_directed:
-                samples.extend(self.directed_vectors.values())
+        if lazy:
+            if dedupe:
+                random_vectors = self._generate_unique_vectors(n, seen=set(directed))
+            else:
+                random_vectors = (self.generate_vector() for _ in range(n))
+            return itertools.chain(directed, random_vectors)
 
-        # Mode: random_only - skip directed vectors entirely
-        # (no action needed, samples stays empty)
+        samples = list(directed)
 
-        # Generate random samples (for all modes except directed_only)
-        if mode != "directed_only":
-            for _ in range(n):
-                samples.append(self.generate_vector())
+        # Generate random samples
+        if dedupe:
+            samples.extend(self._generate_unique_vectors(n, seen=set(samples)))
+        else:
+            samples.extend(self._generate_random_vectors(n))
 
         return samples
 
+    def _generate_unique_vectors(self, n: int, seen: set[tuple]) -> list[tuple]:
+        """
+        Generate up to n random vectors not already present in seen.
+
+        Args:
+            n: Number of random vectors wanted
+            seen: Vectors to exclude; updated with every vector returned
+
+        Returns:
+            List of at most n distinct vectors
+        """
+        vectors = []
+        for _ in range(self.max_retries):
+            for vector in self._generate_random_vectors(n - len(vectors)):
+                if vector not in seen:
+                    seen.add(vector)
+                    vectors.append(vector)
+            if len(vectors) == n:
+                break
+        return vectors
+
+    def _generate_random_vectors(self, n: int) -> list[tuple]:
+        """
+        Generate n random vectors column by column.
+
+        Each TestArg produces its whole column in one generate_batch() call and
+        the columns are zipped into vectors. The vector constraints are then
+        applied to the whole batch at once, and the rejected rows are redrawn as
+        a smaller batch, up to max_retries rounds.
+
+        Args:
+            n: Number of random vectors to generate
+
+        Returns:
+            List of n parameter vectors
+
+        Raises:
+            ValueError: If constraints reject too many vectors
+        """
+        if n <= 0:
+            return []
+        if not self.test_args:
+            return [self.generate_vector() for _ in range(n)]
+
+        if not self.vector_constraints:
+            return self._generate_batch(n)
+
+        pairs = self._ordering_pairs()
+        vectors = []
+        for _ in range(self.max_retries):
+            batch = self._generate_batch(n - len(vectors))
+            if pairs:
+                batch = [self._order_vector(v, pairs) for v in batch]
+            vectors.extend(self._filter_vectors(batch))
+            if len(vectors) == n:
+                return vectors
+
+        raise ValueError(
+            f"Could not generate valid vector after {self.max_retries} attempts. "
+            "Check your constraints."
+        )
+
+    def _generate_batch(self, n: int) -> list[tuple]:
+        """Draw n unconstrained vectors, one generate_batch() column per TestArg."""
+        columns = [arg.generate_batch(n) for arg in self.test_args]
+        return list(zip(*columns))
+
+    def _filter_vectors(self, vectors: list[tuple]) -> list[tuple]:
+        """
+        Keep only the vectors that satisfy every constraint.
+
+        Runs a single filter() pass with the fused constraint check, so each
+        vector is tested with one call and constraints short-circuit on the
+        first failure.
+
+        Args:
+            vectors: Candidate parameter vectors
+
+        Returns:
+            List of vectors passing all constraints, in their original order
+        """
+        return list(filter(self._fused_constraint(), vectors))
+
+    def generate_combinations(self) -> list[tuple]:
+        """
+        Generate every combination of the arguments' finite value sets.
+
+        Each argument contributes its static value, its directed values and,
+        when the RNG type has a finite domain (RNGBoolean, RNGChoice, RNGEnum),
+        every value that type can produce. The cartesian product is built with
+        itertools.product and then filtered by the vector constraints.
+
+        Returns:
+            List of parameter vectors (tuples) satisfying all constraints
+
+        Raises:
+            ValueError: If an argument has no finite set of values
+
+        Example:
+            param = Parameter(
+                TestArg("mode", rng_type=RNGChoice(["fast", "slow"])),
+                TestArg("enabled", rng_type=RNGBoolean()),
+            )
+            param.generate_combinations()
+            # [("fast", False), ("fast", True), ("slow", False), ("slow", True)]
+        """
+        domains = [self._arg_domain(arg) for arg in self.test_args]
+        vectors = list(itertools.product(*domains))
+
+        if self.vector_constraints:
+            vectors = self._filter_vectors(vectors)
+
+        return vectors
+
+    @staticmethod
+    def _arg_domain(arg: TestArg) -> list:
+        """
+        Get the finite list of values an argument can take.
+
+        Args:
+            arg: The TestArg to enumerate
+
+        Returns:
+            Directed values followed by the RNG type's domain, without duplicates
+
+        Raises:
+            ValueError: If the argument has no finite set of values
+        """
+        if arg.is_static:
+            return arg.directed_values or [arg.generate()]
+
+        values = list(arg.directed_values)
+        rng_domain = getattr(arg.rng_type, "domain", None)
+        if rng_domain is not None:
+            values.extend(v for v in rng_domain if v not in values)
+
+        if not values:
+            raise ValueError(
+                f"Argument '{arg.name}' has no finite set of values to combine. "
+                "Use a finite RNG type (RNGBoolean, RNGChoice, RNGEnum) or directed_values."
+            )
+        return values
+
     # ====
     # CLI Support
     # ====
@@ -304,13 +685,13 @@ class Parameter:
         Raises:
             IndexError: If index is out of range
         """
-        names = list(self.directed_vectors.keys())
-        if index < 0 or index >= len(names):
+        count = len(self.directed_vectors)
+        if index < 0 or index >= count:
             raise IndexError(
                 f"Vector index {index} out of range. "
-                f"Valid range: 0-{len(names)-1}"
+                f"Valid range: 0-{count-1}"
             )
-        return self.directed_vectors[names[index]]
+        return next(itertools.islice(self.directed_vectors.values(), index, None))
 
     def list_vector_names(self) -> list[str]:
         """
@@ -349,17 +730,17 @@ class Parameter:
     @property
     def arg_names(self) -> tuple[str, ...]:
         """Get tuple of argument names."""
-        return tuple(arg.name for arg in self.test_args)
+        return self._arg_names
 
     @property
     def arg_types(self) -> tuple[type, ...]:
         """Get tuple of argument types."""
-        return tuple(arg.type for arg in self.test_args)
+        return self._arg_types
 
     @property
     def vector_names(self) -> list[str]:
         """Get list of directed vector names."""
-        return list(self.directed_vectors.keys())
+        return list(self.directed_vectors)
 
     @property
     def num_args(self) -> int:
@@ -384,10 +765,10 @@ class Parameter:
         Raises:
             KeyError: If argument name doesn't exist
         """
-        for arg in self.test_args:
-            if arg.name == name:
-                return arg
-        raise KeyError(f"No argument named '{name}'")
+        try:
+            return self._arg_by_name[name]
+        except KeyError:
+            raise KeyError(f"No argument named '{name}'") from None
 
     # ====
     # String Representation
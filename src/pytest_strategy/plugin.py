@@ -4,10 +4,44 @@ Pytest plugin for pytest-strategies with auto-discovery of strategy definitions.
 import pytest
 from pytest import Config, Session
 from pathlib import Path
+import hashlib
 import importlib.util
+import inspect
+import os
+import re
 import sys
 from typing import List
 
+from .rng import RNG
+from .strategy import Strategy
+
+
+# Key under pytest's cache directory holding vectors that already passed
+PASSED_VECTORS_CACHE_KEY = "pytest-strategies/passed-vectors"
+
+# Key under pytest's cache directory holding registration scan results per file
+SCAN_CACHE_KEY = "pytest-strategies/registration-scan"
+
+# File names picked up by strategy auto-discovery
+STRATEGY_FILE_NAMES = frozenset({"strategies.py", "strategy.py"})
+STRATEGY_FILE_SUFFIXES = ("_strategies.py", "_strategy.py")
+
+# Directories never searched for strategy files, on top of hidden ones and
+# __pycache__; overridable with the strategies_exclude_dirs ini option
+DEFAULT_EXCLUDED_DIRS = ("node_modules", "venv", "build", "dist")
+
+# Matches @Strategy.register / @strategy.register in raw file bytes
+REGISTRATION_PATTERN = re.compile(rb"@[Ss]trategy\.register")
+
+# Bytes read before giving up on finding a registration near the top of a file
+SCAN_HEAD_BYTES = 65536
+
+# Files outside these sizes are not scanned: smaller ones cannot hold a
+# registration, larger ones are not plausible strategy modules; the upper bound
+# is overridable with the strategies_max_scan_bytes ini option
+MIN_SCAN_BYTES = len(b"@Strategy.register")
+DEFAULT_MAX_SCAN_BYTES = 2 * 1024 * 1024
+
 
 class PytestStrategyPlugin:
     """
@@ -20,6 +54,11 @@ class PytestStrategyPlugin:
     def __init__(self):
         self.strategies_loaded = False
         self.discovered_files = []
+        self.passed_vectors = None
+        self._source_hashes = {}
+        self._vector_cache_keys = {}
+        # Node IDs whose call passed, awaiting a clean teardown
+        self._passed_calls = set()
 
     # ==== CONFIGURATION HOOKS ====
 
@@ -28,9 +67,6 @@ class PytestStrategyPlugin:
         """
         Configure the plugin and set up Strategy class with config.
         """
-        from .strategy import Strategy
-        from .rng import RNG
-
         # Get CLI options
         rng_seed = config.getoption("--rng-seed", None)
 
@@ -44,11 +80,6 @@ class PytestStrategyPlugin:
             "strategy(name): mark test to use a specific strategy"
         )
 
-    @pytest.hookimpl
-    def pytest_unconfigure(self, config: Config) -> None:
-        """Clean up when pytest is unconfiguring."""
-        pass
-
     # ==== SESSION HOOKS ====
 
     @pytest.hookimpl(tryfirst=True)
@@ -66,16 +97,38 @@ class PytestStrategyPlugin:
 
         # Get the root directory for tests
         rootdir = Path(config.rootpath)
+        strategies_paths = config.getini("strategies_paths")
         testpaths = config.getini("testpaths")
 
-        # Determine search paths
-        if testpaths:
+        # Determine search paths; explicit strategies_paths win over testpaths
+        if strategies_paths:
+            search_paths = list(strategies_paths)
+        elif testpaths:
             search_paths = [rootdir / path for path in testpaths]
         else:
             search_paths = [rootdir]
 
+        # Reuse registration scans of files unchanged since the last session
+        cache = getattr(config, "cache", None)
+        scan_cache = cache.get(SCAN_CACHE_KEY, {}) if cache is not None else {}
+        previous_scan = dict(scan_cache)
+
         # Discover and load strategy files
-        strategy_files = self._discover_strategy_files(search_paths)
+        exclude_dirs = frozenset(config.getini("strategies_exclude_dirs"))
+        max_scan_bytes = config.getini("strategies_max_scan_bytes")
+        try:
+            max_scan_bytes = int(max_scan_bytes)
+        except ValueError:
+            raise pytest.UsageError(
+                f"strategies_max_scan_bytes must be an integer number of bytes, "
+                f"got {max_scan_bytes!r}"
+            ) from None
+        strategy_files = self._discover_strategy_files(
+            search_paths, scan_cache, exclude_dirs, max_scan_bytes
+        )
+
+        if cache is not None and scan_cache != previous_scan:
+            cache.set(SCAN_CACHE_KEY, scan_cache)
 
         if strategy_files:
             self._load_strategy_files(strategy_files, config)
@@ -83,30 +136,88 @@ class PytestStrategyPlugin:
 
     @pytest.hookimpl
     def pytest_sessionfinish(self, session: Session, exitstatus: int) -> None:
-        """Called at the end of the test session."""
-        pass
+        """Persist the passed-vector cache at the end of the test session."""
+        # config.cache is missing when the cacheprovider plugin is disabled
+        cache = getattr(session.config, "cache", None)
+        if self.passed_vectors is not None and cache is not None:
+            cache.set(PASSED_VECTORS_CACHE_KEY, sorted(self.passed_vectors))
 
     # ==== COLLECTION HOOKS ====
 
     @pytest.hookimpl
     def pytest_collection_modifyitems(self, config: Config, items: List) -> None:
-        """Modify collected test items if needed."""
-        pass
+        """
+        Skip strategy vectors that already passed with unchanged sources.
+
+        Only active with --strategy-cache. A vector is skipped when the same
+        values passed in a previous run and neither the strategy factory nor the
+        test function source changed since.
+        """
+        cache = getattr(config, "cache", None)
+        if not config.getoption("strategy_cache", False) or cache is None:
+            return
+
+        passed_vectors = set(cache.get(PASSED_VECTORS_CACHE_KEY, []))
+        skip_cached = pytest.mark.skip(reason="pytest-strategies: vector passed in a previous run")
+
+        # Only keys of items collected this session are kept, so vectors of
+        # removed or changed tests do not pile up in the cache
+        collected = set()
+        vector_cache_key = self._vector_cache_key
+        for item in items:
+            key = vector_cache_key(item)
+            if key is not None:
+                collected.add(key)
+                if key in passed_vectors:
+                    item.add_marker(skip_cached)
+        self.passed_vectors = passed_vectors & collected
+
+    # ==== RUNTEST HOOKS ====
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report) -> None:
+        """
+        Record the outcome of strategy vectors for the passed-vector cache.
+
+        A vector counts as passed only when its setup, call and teardown all
+        succeed; a failure in any phase drops it from the cache. Skipped
+        vectors (including those skipped by the cache) are left as they are.
+        """
+        if self.passed_vectors is None:
+            return
+
+        nodeid = report.nodeid
+        key = self._vector_cache_keys.get(nodeid)
+        if key is None:
+            return
+
+        if report.failed:
+            self._passed_calls.discard(nodeid)
+            self.passed_vectors.discard(key)
+        elif report.when == "call":
+            if report.passed:
+                self._passed_calls.add(nodeid)
+        elif report.when == "teardown" and nodeid in self._passed_calls:
+            self._passed_calls.discard(nodeid)
+            self.passed_vectors.add(key)
 
     # ==== REPORTING HOOKS ====
 
     @pytest.hookimpl
     def pytest_report_header(self, config: Config, start_path: Path) -> List[str]:
         """Add information to the test report header."""
-        from .strategy import Strategy
-
         lines = []
 
         # Show RNG seed
-        from .rng import RNG
         seed = RNG.get_seed()
         lines.append(f"pytest-strategies: RNG seed = {seed}")
 
+        # Show when discovery is limited to strategies_paths
+        strategies_paths = config.getini("strategies_paths")
+        if strategies_paths:
+            paths = ", ".join(str(path) for path in strategies_paths)
+            lines.append(f"pytest-strategies: strategies_paths = {paths}")
+
         # Show number of registered strategies
         num_strategies = len(Strategy._registry)
         if num_strategies > 0:
@@ -121,8 +232,6 @@ class PytestStrategyPlugin:
     @pytest.hookimpl
     def pytest_terminal_summary(self, terminalreporter, exitstatus: int, config: Config) -> None:
         """Add a section to the terminal summary reporting."""
-        from .strategy import Strategy
-
         # Only show if verbose mode
         if config.option.verbose >= 1:
             terminalreporter.section("Strategy Summary")
@@ -139,70 +248,185 @@ class PytestStrategyPlugin:
 
     # ==== HELPER METHODS ====
 
-    def _discover_strategy_files(self, search_paths: List[Path]) -> List[Path]:
+    def _vector_cache_key(self, item) -> str | None:
+        """
+        Build the passed-vector cache key for a collected test item.
+
+        The key hashes the strategy factory source, the test function source and
+        the repr of the parametrized values.
+
+        Args:
+            item: Collected pytest item
+
+        Returns:
+            Cache key, or None if the item is not strategy-driven or its
+            sources cannot be read
+        """
+        function = getattr(item, "function", None)
+        callspec = getattr(item, "callspec", None)
+        name = getattr(function, "_strategy_name", None)
+        if name is None or callspec is None or name not in Strategy._registry:
+            return None
+
+        source_hash = self._source_hashes.get(function)
+        if source_hash is None:
+            try:
+                source = inspect.getsource(Strategy._registry[name]) + inspect.getsource(function)
+            except (OSError, TypeError):
+                return None
+            source_hash = hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+            self._source_hashes[function] = source_hash
+
+        values = repr(sorted(callspec.params.items()))
+        key = hashlib.blake2b(f"{source_hash}:{values}".encode(), digest_size=16).hexdigest()
+        self._vector_cache_keys[item.nodeid] = key
+        return key
+
+    def _discover_strategy_files(
+        self,
+        search_paths: List[Path],
+        scan_cache: dict | None = None,
+        exclude_dirs: frozenset = frozenset(DEFAULT_EXCLUDED_DIRS),
+        max_scan_bytes: int = DEFAULT_MAX_SCAN_BYTES,
+    ) -> List[Path]:
         """
         Discover strategy definition files in the test directory.
 
         Looks for files matching these patterns:
         - **/strategies.py
         - **/strategy.py
-        - **/test_strategies.py (only if it contains @Strategy.register)
-        - **/*_strategies.py
-        - **/*_strategy.py
+        - **/*_strategies.py (only if it contains @Strategy.register)
+        - **/*_strategy.py (only if it contains @Strategy.register)
+
+        Files named exactly strategies.py or strategy.py are by convention
+        strategy modules and are loaded without reading their contents; only
+        the suffix patterns, which can match unrelated modules, are checked.
+
+        The tree under each search path is walked once; __pycache__, hidden and
+        excluded directories are pruned before descending into them.
 
         Args:
             search_paths: List of paths to search
+            scan_cache: Optional registration scan cache, see
+                _contains_strategy_registration; updated in place
+            exclude_dirs: Directory names to skip, besides hidden directories
+                and __pycache__
+            max_scan_bytes: Suffix-matched files larger than this are skipped
+                without being read
 
         Returns:
             List of discovered strategy file paths
         """
         strategy_files = []
-
-        patterns = [
-            "**/strategies.py",
-            "**/strategy.py",
-            "**/*_strategies.py",
-            "**/*_strategy.py",
-        ]
+        seen = set()
 
         for search_path in search_paths:
             if not search_path.exists():
                 continue
 
-            for pattern in patterns:
-                for file_path in search_path.glob(pattern):
-                    # Skip __pycache__ and hidden directories
-                    if any(part.startswith('.') or part == '__pycache__' 
-                           for part in file_path.parts):
+            # Resolve so that spellings like "tests" and "tests/../tests" yield
+            # identical paths for the seen-set
+            for dirpath, dirnames, filenames in os.walk(search_path.resolve()):
+                # Skip __pycache__, hidden and excluded directories; sorted for a
+                # stable load order
+                dirnames[:] = sorted(
+                    d for d in dirnames
+                    if not d.startswith('.') and d != '__pycache__' and d not in exclude_dirs
+                )
+
+                for name in sorted(filenames):
+                    if name not in STRATEGY_FILE_NAMES and not name.endswith(STRATEGY_FILE_SUFFIXES):
+                        continue
+                    if name.startswith('.'):
                         continue
 
+                    file_path = Path(dirpath) / name
+
                     # Skip if already found
-                    if file_path in strategy_files:
+                    if file_path in seen:
                         continue
+                    seen.add(file_path)
 
-                    # Check if file contains strategy registrations
-                    if self._contains_strategy_registration(file_path):
+                    # Canonical names are taken as is; suffix matches must
+                    # contain strategy registrations
+                    if (name in STRATEGY_FILE_NAMES
+                            or self._contains_strategy_registration(
+                                file_path, scan_cache, max_scan_bytes)):
                         strategy_files.append(file_path)
 
         return strategy_files
 
-    def _contains_strategy_registration(self, file_path: Path) -> bool:
+    def _contains_strategy_registration(
+        self,
+        file_path: Path,
+        scan_cache: dict | None = None,
+        max_scan_bytes: int = DEFAULT_MAX_SCAN_BYTES,
+    ) -> bool:
         """
         Check if a file contains @Strategy.register decorators.
 
         Args:
             file_path: Path to the file to check
+            scan_cache: Optional dict mapping file paths to
+                [mtime_ns, size, result]; a matching entry skips reading the
+                file, and new results are stored in it
+            max_scan_bytes: Files larger than this are reported as not
+                containing registrations without being read
 
         Returns:
             True if file contains strategy registrations
         """
         try:
-            content = file_path.read_text(encoding='utf-8')
-            # Look for @Strategy.register pattern
-            return '@Strategy.register' in content or '@strategy.register' in content
-        except Exception:
+            stat = file_path.stat()
+        except OSError:
+            return False
+
+        # Too small to hold a registration, or too large to be a strategy module
+        if not MIN_SCAN_BYTES <= stat.st_size <= max_scan_bytes:
+            return False
+
+        key = str(file_path)
+        if scan_cache is not None:
+            entry = scan_cache.get(key)
+            if entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+                return entry[2]
+
+        try:
+            found = self._scan_for_registration(file_path)
+        except OSError:
+            # Bytes are scanned without decoding, so only I/O can fail here
             return False
 
+        if scan_cache is not None:
+            scan_cache[key] = [stat.st_mtime_ns, stat.st_size, found]
+        return found
+
+    @staticmethod
+    def _scan_for_registration(file_path: Path) -> bool:
+        """
+        Search a file's raw bytes for a strategy registration decorator.
+
+        Registrations almost always sit near the top of a module, so only the
+        first SCAN_HEAD_BYTES are read at first; the rest of the file is read
+        only if the head has no match. The pattern is ASCII, so no decoding is
+        needed.
+
+        Args:
+            file_path: Path to the file to scan
+
+        Returns:
+            True if the file contains @Strategy.register or @strategy.register
+        """
+        with file_path.open('rb') as f:
+            head = f.read(SCAN_HEAD_BYTES)
+            if REGISTRATION_PATTERN.search(head):
+                return True
+            if len(head) < SCAN_HEAD_BYTES:
+                return False
+            # Keep enough of the head to catch a match split across the boundary
+            overlap = len(REGISTRATION_PATTERN.pattern)
+            return REGISTRATION_PATTERN.search(head[-overlap:] + f.read()) is not None
+
     def _load_strategy_files(self, strategy_files: List[Path], config: Config) -> None:
         """
         Load strategy definition files by importing them.
@@ -211,30 +435,41 @@ class PytestStrategyPlugin:
             strategy_files: List of strategy file paths to load
             config: Pytest config object
         """
-        from .strategy import Strategy
+        spec_from_file_location = importlib.util.spec_from_file_location
+        module_from_spec = importlib.util.module_from_spec
+        verbose = config.option.verbose
+        root_prefix = str(config.rootpath) + os.sep
 
+        # First pass: build a module for every file, then register them all at once
+        pending = []
         for file_path in strategy_files:
-            try:
-                # Create a module name from the file path
-                module_name = self._create_module_name(file_path, config)
+            # Create a module name from the file path
+            module_name = self._create_module_name(file_path, config)
+            spec = spec_from_file_location(module_name, file_path)
+            if spec and spec.loader:
+                pending.append((file_path, module_name, spec, module_from_spec(spec)))
 
-                # Load the module
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    sys.modules[module_name] = module
-                    spec.loader.exec_module(module)
-
-                    self.discovered_files.append(file_path)
-
-                    # Optionally log in verbose mode
-                    if config.option.verbose >= 2:
-                        print(f"pytest-strategies: Loaded {file_path.relative_to(config.rootpath)}")
+        sys.modules.update({module_name: module for _, module_name, _, module in pending})
 
+        # Second pass: run the modules; only user code can fail here
+        for file_path, module_name, spec, module in pending:
+            try:
+                spec.loader.exec_module(module)
             except Exception as e:
+                sys.modules.pop(module_name, None)
                 # Log error but don't fail the test session
-                if config.option.verbose >= 1:
+                if verbose >= 1:
                     print(f"pytest-strategies: Warning - Failed to load {file_path}: {e}")
+                continue
+
+            self.discovered_files.append(file_path)
+
+            # Optionally log in verbose mode
+            if verbose >= 2:
+                name = str(file_path)
+                if name.startswith(root_prefix):
+                    name = name[len(root_prefix):]
+                print(f"pytest-strategies: Loaded {name}")
 
     def _create_module_name(self, file_path: Path, config: Config) -> str:
         """
@@ -247,19 +482,17 @@ class PytestStrategyPlugin:
         Returns:
             Module name string
         """
-        try:
-            # Try to create relative path from rootpath
-            rel_path = file_path.relative_to(config.rootpath)
-            # Convert path to module name
+        root = config.rootpath
+        if file_path.is_relative_to(root):
+            # Convert the path relative to rootpath to a module name
+            rel_path = file_path.relative_to(root)
             module_name = str(rel_path.with_suffix('')).replace('/', '.').replace('\\', '.')
             return f"pytest_strategies_discovered.{module_name}"
-        except ValueError:
-            # If relative path fails, use absolute path hash
-            return f"pytest_strategies_discovered.{file_path.stem}_{hash(str(file_path))}"
-
 
-# Plugin instance
-_plugin_instance = PytestStrategyPlugin()
+        # Outside rootpath, use a hash of the absolute path; blake2b, unlike
+        # hash(), is stable across runs so the module name is too
+        digest = hashlib.blake2b(str(file_path).encode(), digest_size=8).hexdigest()
+        return f"pytest_strategies_discovered.{file_path.stem}_{digest}"
 
 
 def pytest_addoption(parser) -> None:
@@ -306,6 +539,37 @@ def pytest_addoption(parser) -> None:
         help="Run only the directed vector at this index"
     )
 
+    group.addoption(
+        "--strategy-cache",
+        action="store_true",
+        default=False,
+        help="Skip strategy vectors that passed in a previous run with unchanged "
+             "strategy and test sources"
+    )
+
+    parser.addini(
+        "strategies_paths",
+        type="paths",
+        default=[],
+        help="Directories searched for strategy files instead of testpaths "
+             "or the root directory"
+    )
+
+    parser.addini(
+        "strategies_exclude_dirs",
+        type="args",
+        default=list(DEFAULT_EXCLUDED_DIRS),
+        help="Directory names skipped by strategy file auto-discovery "
+             "(hidden directories and __pycache__ are always skipped)"
+    )
+
+    parser.addini(
+        "strategies_max_scan_bytes",
+        default=str(DEFAULT_MAX_SCAN_BYTES),
+        help="Size in bytes above which *_strategies.py / *_strategy.py files "
+             "are skipped without being read"
+    )
+
     group.addoption(
         "--list-strategies",
         action="store_true",
@@ -315,16 +579,18 @@ def pytest_addoption(parser) -> None:
 
 
 def pytest_configure(config):
-    """Register the plugin instance."""
+    """Create and register the plugin instance for this config."""
     if not hasattr(config, '_strategy_plugin_instance'):
-        config._strategy_plugin_instance = _plugin_instance
-        config.pluginmanager.register(_plugin_instance, "pytest-strategies")
+        plugin = PytestStrategyPlugin()
+        config._strategy_plugin_instance = plugin
+        config.pluginmanager.register(plugin, "pytest-strategies")
 
 
 def pytest_unconfigure(config):
     """Unregister the plugin instance."""
-    if hasattr(config, '_strategy_plugin_instance'):
-        config.pluginmanager.unregister(_plugin_instance, "pytest-strategies")
+    plugin = getattr(config, '_strategy_plugin_instance', None)
+    if plugin is not None:
+        config.pluginmanager.unregister(plugin, "pytest-strategies")
         delattr(config, '_strategy_plugin_instance')
 
 
@@ -336,8 +602,6 @@ def pytest_collection_finish(session: Session) -> None:
     config = session.config
 
     if config.option.list_strategies:
-        from .strategies import Strategy
-
         terminalreporter = config.pluginmanager.get_plugin("terminalreporter")
 
         if terminalreporter:
@@ -1,11 +1,28 @@
 # rng.py
 
 from typing import Callable, Type
+from bisect import bisect
 from enum import Enum
+from functools import partial
+import itertools
 import random
 import time
 
 
+# Generator behind every RNG draw; kept apart from the global random module so
+# other code consuming that state cannot shift the sequence of a seeded run
+_rng = random.Random()
+
+# Bound methods of _rng, looked up once instead of on every draw
+_randint = _rng.randint
+_uniform = _rng.uniform
+_random = _rng.random
+_choice = _rng.choice
+_getrandbits = _rng.getrandbits
+_choices = _rng.choices
+_randrange = _rng.randrange
+
+
 class RNGValueError(Exception):
     """Exception raised when an invalid value is provided to RNG operations."""
     pass
@@ -14,29 +31,79 @@ class RNGValueError(Exception):
 class RNG:
     """Core RNG singleton managing seed and random state"""
 
-    _seed = time.time_ns()
+    _seed: int | None = None
     _max_retries = 100
+    # Starting state of each named stream under the current seed, so a stream
+    # is seeded once and later refreshes just restore it
+    _stream_states: dict[str, tuple] = {}
 
     # ====
     # Seed Management
     # ====
 
+    @staticmethod
+    def _apply_seed(seed: int):
+        """Seed the RNG generator, and the global random module for factories using it directly"""
+        RNG._stream_states.clear()
+        _rng.seed(seed)
+        random.seed(seed)
+
+    @staticmethod
+    def _ensure_seed() -> int:
+        """Pick a time-based seed on first use and apply it to the random state"""
+        if RNG._seed is None:
+            RNG._seed = time.time_ns()
+            RNG._apply_seed(RNG._seed)
+        return RNG._seed
+
     @staticmethod
     def seed(seed: int | None = None):
-        """Set the random seed and refresh the random state"""
+        """Set the random seed and refresh the random state.
+
+        Passing None keeps the current seed, choosing a time-based one if
+        none has been set yet, and re-applies it to the random state.
+        """
         if seed is not None:
             RNG._seed = seed
-            random.seed(RNG._seed)
+        RNG._apply_seed(RNG._ensure_seed())
 
     @staticmethod
     def get_seed():
         """Get the current seed value"""
-        return RNG._seed
+        return RNG._ensure_seed()
+
+    @staticmethod
+    def refresh_seed(stream: str | None = None):
+        """Refresh the random state with the current seed.
+
+        Args:
+            stream: Optional name mixed into the seed, so that different names
+                (e.g. strategies) get independent sequences that are each still
+                reproducible from the seed alone. Only the RNG generator is
+                restarted for a stream; the global random module is left alone.
+        """
+        seed = RNG._ensure_seed()
+        if stream is None:
+            RNG._apply_seed(seed)
+            return
+        state = RNG._stream_states.get(stream)
+        if state is None:
+            # str seeds are hashed with SHA-512, so they are stable across runs
+            _rng.seed(f"{seed}/{stream}")
+            RNG._stream_states[stream] = _rng.getstate()
+        else:
+            _rng.setstate(state)
 
     @staticmethod
-    def refresh_seed():
-        """Refresh the random state with the current seed"""
-        random.seed(RNG._seed)
+    def get_state() -> tuple:
+        """Get the full random state, for restoring later with set_state()"""
+        return _rng.getstate(), random.getstate()
+
+    @staticmethod
+    def set_state(state: tuple):
+        """Restore a random state returned by get_state()"""
+        _rng.setstate(state[0])
+        random.setstate(state[1])
 
     @staticmethod
     def set_max_retries(retries: int):
@@ -74,6 +141,38 @@ class RNG:
             f"No valid value found after {RNG._max_retries} attempts"
         )
 
+    @staticmethod
+    def _generate_batch_with_constraint(generator: Callable, predicate: Callable, size: int) -> list:
+        """
+        Helper to generate a batch of values satisfying a predicate.
+
+        Draws a full batch, keeps the values passing the predicate and redraws
+        only the missing ones, rather than retrying value by value.
+
+        Args:
+            generator: Function taking a count and returning that many random values
+            predicate: Function to validate the generated values
+            size: Number of values to generate
+
+        Returns:
+            List of size values that satisfy the predicate
+
+        Raises:
+            RNGValueError: If the batch is still short after max_retries rounds
+        """
+        values = []
+        for _ in range(RNG._max_retries):
+            missing = size - len(values)
+            if missing <= 0:
+                return values
+            values.extend(filter(predicate, generator(missing)))
+
+        if len(values) >= size:
+            return values
+        raise RNGValueError(
+            f"No valid value found after {RNG._max_retries} attempts"
+        )
+
     # ====
     # Basic Generators
     # ====
@@ -95,9 +194,16 @@ class RNG:
             RNG.integer(1, 100)
             RNG.integer(1, 100, predicate=lambda x: x % 2 == 0)  # Even numbers only
         """
-        return RNG._generate_with_constraint(
-            lambda: random.randint(min, max),
-            predicate
+        if predicate is None:
+            return _randint(min, max)
+        # Same loop as _generate_with_constraint, inlined to skip the helper
+        # call and the partial() built per draw
+        for _ in range(RNG._max_retries):
+            value = _randint(min, max)
+            if predicate(value):
+                return value
+        raise RNGValueError(
+            f"No valid value found after {RNG._max_retries} attempts"
         )
 
     @staticmethod
@@ -117,9 +223,16 @@ class RNG:
             RNG.float(0.0, 10.0)
             RNG.float(0.0, 1.0, predicate=lambda x: x > 0.5)
         """
-        return RNG._generate_with_constraint(
-            lambda: random.uniform(min, max),
-            predicate
+        if predicate is None:
+            return _uniform(min, max)
+        # Same loop as _generate_with_constraint, inlined to skip the helper
+        # call and the partial() built per draw
+        for _ in range(RNG._max_retries):
+            value = _uniform(min, max)
+            if predicate(value):
+                return value
+        raise RNGValueError(
+            f"No valid value found after {RNG._max_retries} attempts"
         )
 
     @staticmethod
@@ -137,7 +250,10 @@ class RNG:
             RNG.boolean()  # 50/50
             RNG.boolean(0.8)  # 80% True, 20% False
         """
-        return random.random() < true_probability
+        if true_probability == 0.5:
+            # A fair coin needs one bit, not a full 53-bit float
+            return bool(_getrandbits(1))
+        return _random() < true_probability
 
     @staticmethod
     def choice(items: list):
@@ -158,7 +274,7 @@ class RNG:
         """
         if not items:
             raise RNGValueError("The choices list cannot be empty.")
-        return random.choice(items)
+        return _choice(items)
 
     @staticmethod
     def string(
@@ -192,8 +308,164 @@ class RNG:
             raise ValueError("String length cannot be negative")
         
         if length is None:
-            length = random.randint(min_length, max_length)
-        return ''.join(random.choice(charset) for _ in range(length))
+            length = _randint(min_length, max_length)
+        return ''.join(_choices(charset, k=length))
+
+    @staticmethod
+    def strings(
+        size: int,
+        length: int | None = None,
+        min_length: int = 1,
+        max_length: int = 20,
+        charset: str = "abcdefghijklmnopqrstuvwxyz"
+    ) -> list:
+        """
+        Generate several random strings at once.
+
+        All characters are drawn with a single random.choices() call and then
+        sliced into strings.
+
+        Args:
+            size: Number of strings to generate
+            length: Fixed length (if None, random between min_length and max_length)
+            min_length: Minimum length if length is None (default: 1)
+            max_length: Maximum length if length is None (default: 20)
+            charset: Characters to choose from (default: lowercase letters)
+
+        Returns:
+            List of random strings
+
+        Raises:
+            ValueError: If length is negative
+
+        Example:
+            RNG.strings(5, length=8)  # Five 8-character strings
+        """
+        if length is not None and length < 0:
+            raise ValueError("String length cannot be negative")
+
+        if length is None:
+            lengths = RNG.integers(min_length, max_length, size)
+        else:
+            lengths = [length] * size
+
+        chars = ''.join(_choices(charset, k=sum(lengths)))
+        result = []
+        start = 0
+        for n in lengths:
+            result.append(chars[start:start + n])
+            start += n
+        return result
+
+    # ====
+    # Batch Generators
+    # ====
+
+    @staticmethod
+    def integers(min: int, max: int, size: int, predicate: Callable | None = None) -> list:
+        """
+        Generate several random integers within the specified range at once.
+
+        Args:
+            min: Minimum value (inclusive)
+            max: Maximum value (inclusive)
+            size: Number of values to generate
+            predicate: Optional constraint function
+
+        Returns:
+            List of random integers satisfying constraints
+
+        Raises:
+            RNGValueError: If not enough valid values are found within max_retries batches
+
+        Example:
+            RNG.integers(1, 6, 100)  # 100 dice rolls
+            RNG.integers(1, 100, 10, predicate=lambda x: x % 2 == 0)
+        """
+        if predicate is not None:
+            return RNG._generate_batch_with_constraint(
+                partial(RNG.integers, min, max), predicate, size
+            )
+        # random.choices indexes the range with floor(random() * span), which
+        # favours some values by up to span / 2**53 relative to the rest; keep
+        # it to spans where that bias is negligible and use randrange above
+        if 0 < max - min + 1 <= 2**32:
+            return _choices(range(min, max + 1), k=size)
+        randrange = _randrange
+        return [randrange(min, max + 1) for _ in range(size)]
+
+    @staticmethod
+    def floats(min: float, max: float, size: int, predicate: Callable | None = None) -> list:
+        """
+        Generate several random floats within the specified range at once.
+
+        Args:
+            min: Minimum value (inclusive)
+            max: Maximum value (inclusive)
+            size: Number of values to generate
+            predicate: Optional constraint function
+
+        Returns:
+            List of random floats satisfying constraints
+
+        Raises:
+            RNGValueError: If not enough valid values are found within max_retries batches
+
+        Example:
+            RNG.floats(0.0, 1.0, 100)
+        """
+        if predicate is not None:
+            return RNG._generate_batch_with_constraint(
+                partial(RNG.floats, min, max), predicate, size
+            )
+        # Same formula as random.uniform, without the per-value call
+        span, rand = max - min, _random
+        return [min + span * rand() for _ in range(size)]
+
+    @staticmethod
+    def booleans(size: int, true_probability: float = 0.5) -> list:
+        """
+        Generate several random booleans at once.
+
+        Args:
+            size: Number of values to generate
+            true_probability: Probability of each value being True (0.0 to 1.0)
+
+        Returns:
+            List of random booleans
+
+        Example:
+            RNG.booleans(100)  # 100 fair coin flips
+        """
+        if size <= 0:
+            return []
+        if true_probability == 0.5:
+            # size fair coins from a single size-bit draw
+            return [bit == "1" for bit in format(_getrandbits(size), f"0{size}b")]
+        rand = _random
+        return [rand() < true_probability for _ in range(size)]
+
+    @staticmethod
+    def choices(items: list, size: int) -> list:
+        """
+        Choose several random items from a list, with replacement.
+
+        Args:
+            items: List of items to choose from
+            size: Number of items to choose
+
+        Returns:
+            List of randomly chosen items
+
+        Raises:
+            RNGValueError: If the list is empty
+
+        Example:
+            RNG.choices(['a', 'b', 'c'], 10)
+        """
+        if not items:
+            raise RNGValueError("The choices list cannot be empty.")
+        return _choices(items, k=size)
 
     # ====
     # Weighted Generators
@@ -221,11 +493,8 @@ class RNG:
             })
         """
         range_list = list(ranges.keys())
-        weights = list(ranges.values())
-
-        # Choose range using random.choices (handles normalization)
-        chosen_range = random.choices(range_list, weights=weights, k=1)[0]
-        min_val, max_val = chosen_range
+        cum_weights = list(itertools.accumulate(ranges.values()))
+        min_val, max_val = RNG._choose_range(range_list, cum_weights)
 
         return RNG.integer(min_val, max_val, predicate)
 
@@ -251,34 +520,90 @@ class RNG:
             })
         """
         range_list = list(ranges.keys())
-        weights = list(ranges.values())
-
-        chosen_range = random.choices(range_list, weights=weights, k=1)[0]
-        min_val, max_val = chosen_range
+        cum_weights = list(itertools.accumulate(ranges.values()))
+        min_val, max_val = RNG._choose_range(range_list, cum_weights)
 
         return RNG.float(min_val, max_val, predicate)
 
+    @staticmethod
+    def _choose_range(range_list: list, cum_weights: list) -> tuple:
+        """
+        Choose a (min, max) range by cumulative weight.
+
+        Bisects a single uniform draw scaled by the total weight, which is what
+        random.choices does per value, without its argument handling and list
+        allocation; callers that draw repeatedly from the same ranges can
+        precompute cum_weights once.
+        """
+        total = cum_weights[-1]
+        if not total > 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+        return range_list[bisect(cum_weights, _random() * total, 0, len(cum_weights) - 1)]
+
 
 # ====
 # RNG Type Classes
 # ====
 
+def _instance_attributes(obj) -> dict:
+    """
+    Return an object's instance attributes, whether kept in __slots__ or a __dict__.
+
+    The built-in RNG types use __slots__, so vars() no longer works on them;
+    user-defined subclasses without __slots__ still have a __dict__. A private
+    slot backing a public property (e.g. ``_weights`` for ``weights``) is
+    reported under the property's name.
+    """
+    attributes = {}
+    obj_type = type(obj)
+    for cls in reversed(obj_type.__mro__):
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                public = name[1:]
+                if name.startswith("_") and isinstance(getattr(obj_type, public, None), property):
+                    name = public
+                attributes[name] = getattr(obj, name)
+    attributes.update(getattr(obj, "__dict__", {}))
+    return attributes
+
+
 class RNGType:
     """Base class for all RNG types"""
 
+    # Subclasses declare their attributes in __slots__ so generate() reads them
+    # through slot descriptors instead of an instance __dict__
+    __slots__ = ()
+
     def generate(self):
         """Generate a random value based on this type's configuration"""
         raise NotImplementedError
 
+    def generate_batch(self, n: int) -> list:
+        """
+        Generate n random values in one call.
+
+        Subclasses override this with bulk paths that avoid the per-value
+        generate() dispatch; the default simply loops.
+        """
+        return [self.generate() for _ in range(n)]
+
     @property
     def python_type(self):
         """Return the Python type this RNG type generates"""
         raise NotImplementedError
 
+    @property
+    def domain(self) -> list | None:
+        """Return every value this type can generate, or None if not finite"""
+        return None
+
 
 class RNGInteger(RNGType):
     """RNG type for generating integers"""
 
+    __slots__ = ("min", "max", "predicate")
+
     def __init__(
         self,
         min: int | None = None,
@@ -290,8 +615,14 @@ class RNGInteger(RNGType):
         self.predicate = predicate
 
     def generate(self):
+        if self.predicate is None:
+            # Most draws are unconstrained; skip the RNG.integer dispatch
+            return _randint(self.min, self.max)
         return RNG.integer(self.min, self.max, self.predicate)
 
+    def generate_batch(self, n: int) -> list:
+        return RNG.integers(self.min, self.max, n, self.predicate)
+
     @property
     def python_type(self):
         return int
@@ -300,6 +631,8 @@ class RNGInteger(RNGType):
 class RNGFloat(RNGType):
     """RNG type for generating floats"""
 
+    __slots__ = ("min", "max", "predicate")
+
     def __init__(
         self,
         min: float | None = None,
@@ -311,8 +644,14 @@ class RNGFloat(RNGType):
         self.predicate = predicate
 
     def generate(self):
+        if self.predicate is None:
+            # Most draws are unconstrained; skip the RNG.float dispatch
+            return _uniform(self.min, self.max)
         return RNG.float(self.min, self.max, self.predicate)
 
+    def generate_batch(self, n: int) -> list:
+        return RNG.floats(self.min, self.max, n, self.predicate)
+
     @property
     def python_type(self):
         return float
@@ -321,20 +660,32 @@ class RNGFloat(RNGType):
 class RNGBoolean(RNGType):
     """RNG type for generating booleans"""
 
+    __slots__ = ("true_probability",)
+
     def __init__(self, true_probability: float = 0.5):
         self.true_probability = true_probability
 
     def generate(self):
         return RNG.boolean(self.true_probability)
 
+    def generate_batch(self, n: int) -> list:
+        return RNG.booleans(n, self.true_probability)
+
     @property
     def python_type(self):
         return bool
 
+    @property
+    def domain(self) -> list:
+        return [value for value, p in ((False, 1.0 - self.true_probability),
+                                       (True, self.true_probability)) if p > 0]
+
 
 class RNGChoice(RNGType):
     """RNG type for choosing from a list of options"""
 
+    __slots__ = ("choices",)
+
     def __init__(self, choices: list):
         if not choices:
             raise RNGValueError("Choices list cannot be empty")
@@ -343,10 +694,17 @@ class RNGChoice(RNGType):
     def generate(self):
         return RNG.choice(self.choices)
 
+    def generate_batch(self, n: int) -> list:
+        return RNG.choices(self.choices, n)
+
     @property
     def python_type(self):
         return type(self.choices[0]) if self.choices else object
 
+    @property
+    def domain(self) -> list:
+        return list(self.choices)
+
 
 class RNGEnum(RNGType):
     """
@@ -371,6 +729,11 @@ class RNGEnum(RNGType):
         RNGEnum(Priority, weights={Priority.HIGH: 0.6, Priority.MEDIUM: 0.3}, predicate=lambda p: p != Priority.LOW)
     """
 
+    __slots__ = (
+        "enum_class", "_predicate", "_weights", "_weights_key",
+        "_members", "_weighted_members", "_prob", "_alias",
+    )
+
     def __init__(
         self,
         enum_class: Type[Enum],
@@ -394,17 +757,123 @@ class RNGEnum(RNGType):
             raise RNGValueError(f"{enum_class} is not an Enum class")
         
         self.enum_class = enum_class
-        self.weights = weights
-        self.predicate = predicate
-        
+        self._predicate = predicate
+        self.set_weights(weights)
+
+    @property
+    def weights(self) -> dict[Enum, float] | None:
+        """Member weights, or None for uniform selection"""
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: dict[Enum, float] | None):
+        self.set_weights(weights)
+
+    @property
+    def predicate(self) -> Callable[[Enum], bool] | None:
+        """Optional filter on the members that can be drawn"""
+        return self._predicate
+
+    @predicate.setter
+    def predicate(self, predicate: Callable[[Enum], bool] | None):
+        self._predicate = predicate
+        self._build_tables()
+
+    def set_weights(self, weights: dict[Enum, float] | None):
+        """
+        Replace the member weights and rebuild the sampling tables.
+
+        Assigning ``weights`` does the same. Edits made to the weights dict in
+        place are picked up on the next draw.
+
+        Args:
+            weights: Dictionary mapping enum members to their weights, or None
+                    for uniform selection
+
+        Raises:
+            RNGValueError: If weights reference non-existent members
+        """
         # Validate weights if provided
         if weights:
             for member in weights.keys():
-                if not isinstance(member, enum_class):
+                if not isinstance(member, self.enum_class):
                     raise RNGValueError(
-                        f"Weight key {member} is not a member of {enum_class.__name__}"
+                        f"Weight key {member} is not a member of {self.enum_class.__name__}"
                     )
-    
+
+        self._weights = weights
+        self._build_tables()
+
+    def _build_tables(self):
+        """Precompute the sampling tables for the current weights and predicate"""
+        weights = self._weights
+        # Snapshot of the weights the tables were built from, see _sync_tables()
+        self._weights_key = tuple(weights.items()) if weights else None
+
+        if weights:
+            # Precompute the alias table once so each weighted draw is O(1)
+            self._build_alias_table()
+        else:
+            # Materialize the members that pass the predicate once, so uniform
+            # draws index straight into the pool instead of retrying
+            self._members = tuple(
+                member for member in self.enum_class
+                if self.predicate is None or self.predicate(member)
+            )
+
+    def _build_alias_table(self):
+        """
+        Build a Vose alias table for the weighted members.
+
+        Members rejected by the predicate (or with a non-positive weight) get
+        zero mass, so weighted draws never need to be retried.
+        """
+        members = []
+        masses = []
+        for member, weight in self.weights.items():
+            if weight <= 0:
+                continue
+            if self.predicate and not self.predicate(member):
+                continue
+            members.append(member)
+            masses.append(weight)
+
+        n = len(members)
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        if n:
+            # Scale so the average mass is 1.0, then pair under-full and over-full slots
+            total = sum(masses)
+            scaled = [mass * n / total for mass in masses]
+            small = [i for i, p in enumerate(scaled) if p < 1.0]
+            large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+            while small and large:
+                under = small.pop()
+                over = large.pop()
+                prob[under] = scaled[under]
+                alias[under] = over
+                scaled[over] = (scaled[over] + scaled[under]) - 1.0
+                if scaled[over] < 1.0:
+                    small.append(over)
+                else:
+                    large.append(over)
+
+            # Leftovers are full slots (only off by floating point error)
+            for i in small + large:
+                prob[i] = 1.0
+
+        self._weighted_members = members
+        self._prob = prob
+        self._alias = alias
+
+    def _sync_tables(self):
+        """Rebuild the tables if the weights dict was edited in place since they were built"""
+        weights = self._weights
+        if (tuple(weights.items()) if weights else None) != self._weights_key:
+            self.set_weights(weights)
+
     def generate(self) -> Enum:
         """
         Generate a random enum value.
@@ -413,43 +882,62 @@ class RNGEnum(RNGType):
             Random enum member satisfying constraints
             
         Raises:
-            RNGValueError: If no valid value found after max_retries attempts
+            RNGValueError: If no enum member satisfies the predicate
         """
-        if self.weights:
-            # Weighted selection
-            members = list(self.weights.keys())
-            weights = list(self.weights.values())
-            
-            if self.predicate:
-                # With predicate: use retry logic
-                def generator():
-                    return random.choices(members, weights=weights, k=1)[0]
-                return RNG._generate_with_constraint(generator, self.predicate)
-            else:
-                # Without predicate: direct selection
-                return random.choices(members, weights=weights, k=1)[0]
+        self._sync_tables()
+        if self._weights:
+            # Weighted selection via the alias table (predicate already folded in)
+            members = self._check_pool(self._weighted_members)
+            i = _randrange(len(members))
+            if _random() < self._prob[i]:
+                return members[i]
+            return members[self._alias[i]]
         else:
-            # Uniform selection from all members
-            members = list(self.enum_class)
-            
-            if self.predicate:
-                # With predicate: use retry logic
-                def generator():
-                    return random.choice(members)
-                return RNG._generate_with_constraint(generator, self.predicate)
-            else:
-                # Without predicate: direct selection
-                return random.choice(members)
-    
+            # Uniform selection from the pre-filtered pool
+            return _choice(self._check_pool(self._members))
+
+    def generate_batch(self, n: int) -> list:
+        if n <= 0:
+            return []
+
+        self._sync_tables()
+        if self._weights:
+            members = self._check_pool(self._weighted_members)
+            prob, alias, rand = self._prob, self._alias, _random
+            return [
+                members[i] if rand() < prob[i] else members[alias[i]]
+                for i in _choices(range(len(members)), k=n)
+            ]
+
+        return _choices(self._check_pool(self._members), k=n)
+
+    def _check_pool(self, members):
+        """Return the candidate pool, raising if the predicate emptied it"""
+        if not members:
+            kind = "weighted member" if self.weights else "member"
+            raise RNGValueError(
+                f"No valid value found: no {kind} of "
+                f"{self.enum_class.__name__} satisfies the predicate"
+            )
+        return members
+
     @property
     def python_type(self):
         """Return the Enum class type"""
         return self.enum_class
 
+    @property
+    def domain(self) -> list:
+        """Return the members that can be drawn (weighted and passing the predicate)"""
+        self._sync_tables()
+        return list(self._weighted_members if self._weights else self._members)
+
 
 class RNGString(RNGType):
     """RNG type for generating strings"""
 
+    __slots__ = ("length", "min_length", "max_length", "charset")
+
     def __init__(
         self,
         length: int | None = None,
@@ -465,6 +953,9 @@ class RNGString(RNGType):
     def generate(self):
         return RNG.string(self.length, self.min_length, self.max_length, self.charset)
 
+    def generate_batch(self, n: int) -> list:
+        return RNG.strings(n, self.length, self.min_length, self.max_length, self.charset)
+
     @property
     def python_type(self):
         return str
@@ -473,6 +964,8 @@ class RNGString(RNGType):
 class RNGWeightedInteger(RNGType):
     """RNG type for generating weighted integers from multiple ranges"""
 
+    __slots__ = ("ranges", "predicate", "_range_list", "_cum_weights")
+
     def __init__(
         self,
         ranges: dict[tuple[int, int], float],
@@ -480,9 +973,21 @@ class RNGWeightedInteger(RNGType):
     ):
         self.ranges = ranges
         self.predicate = predicate
+        # Precomputed once for RNG._choose_range
+        self._range_list = list(ranges.keys())
+        self._cum_weights = list(itertools.accumulate(ranges.values()))
 
     def generate(self):
-        return RNG.winteger(self.ranges, self.predicate)
+        min_val, max_val = RNG._choose_range(self._range_list, self._cum_weights)
+        return RNG.integer(min_val, max_val, self.predicate)
+
+    def generate_batch(self, n: int) -> list:
+        if self.predicate is not None or n <= 0:
+            return super().generate_batch(n)
+        # Pick all n ranges in one call, then draw within each
+        chosen = _choices(self._range_list, cum_weights=self._cum_weights, k=n)
+        randint = _randint
+        return [randint(lo, hi) for lo, hi in chosen]
 
     @property
     def python_type(self):
@@ -492,6 +997,8 @@ class RNGWeightedInteger(RNGType):
 class RNGWeightedFloat(RNGType):
     """RNG type for generating weighted floats from multiple ranges"""
 
+    __slots__ = ("ranges", "predicate", "_range_list", "_cum_weights")
+
     def __init__(
         self,
         ranges: dict[tuple[float, float], float],
@@ -499,9 +1006,21 @@ class RNGWeightedFloat(RNGType):
     ):
         self.ranges = ranges
         self.predicate = predicate
+        # Precomputed once for RNG._choose_range
+        self._range_list = list(ranges.keys())
+        self._cum_weights = list(itertools.accumulate(ranges.values()))
 
     def generate(self):
-        return RNG.wfloat(self.ranges, self.predicate)
+        min_val, max_val = RNG._choose_range(self._range_list, self._cum_weights)
+        return RNG.float(min_val, max_val, self.predicate)
+
+    def generate_batch(self, n: int) -> list:
+        if self.predicate is not None or n <= 0:
+            return super().generate_batch(n)
+        # Pick all n ranges in one call, then draw within each as random.uniform does
+        chosen = _choices(self._range_list, cum_weights=self._cum_weights, k=n)
+        rand = _random
+        return [lo + (hi - lo) * rand() for lo, hi in chosen]
 
     @property
     def python_type(self):
@@ -1,11 +1,17 @@
+import contextlib
 import inspect
+import types
+import weakref
 import pytest
 from dataclasses import is_dataclass, fields
-from typing import Callable, Sequence, Any, Tuple
+from typing import Callable, Mapping, Sequence, Any, Tuple
 
 from .rng import RNG
 from .parameters import Parameter
-from .test_args import TestArg
+
+# (parameter names, annotations) of each inspected test function, held weakly
+# so user functions carry no extra attributes and are not kept alive
+_test_parameters_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
 class Strategy:
@@ -16,17 +22,44 @@ class Strategy:
 
     _registry: dict[str, Callable[[int], Tuple[Sequence[str], Sequence[Any]]]] = {}
 
+    # Whether each registered factory takes nsamples by keyword, worked out from
+    # its signature at registration
+    _nsamples_by_keyword: dict[str, bool] = {}
+
+    # Factory outputs keyed by (name, nsamples, seed), so the Parameter and the
+    # tables its RNG types precompute are only built once per strategy
+    _factory_cache: dict[tuple[str, int, int], Any] = {}
+
+    # Samples drawn from a cached Parameter, keyed like _factory_cache plus the
+    # vector mode, name and index options, so each set is drawn only once
+    _samples_cache: dict[tuple, list] = {}
+
+    # (argstr, samples, ids) for named-parameter tests, keyed like _factory_cache
+    # for tuple strategies and like _samples_cache for Parameter ones; samples
+    # are fixed for a key, so ids are built only once
+    _named_cache: dict[tuple, tuple[str, list, list[str]]] = {}
+
+    # (argstr, argname set) for each argnames tuple, shared by every test
+    # decorated with a strategy producing those argnames
+    _arg_meta: dict[tuple[str, ...], tuple[str, frozenset[str]]] = {}
+
+    # Field names of each dataclass used as a test parameter, in declaration order
+    _dataclass_fields: dict[type, tuple[str, ...]] = {}
+
+    # Generated sample -> instance constructors keyed by (dataclass, argnames)
+    _dataclass_builders: dict[tuple[type, tuple[str, ...]], Callable[[tuple], Any]] = {}
+
     # Global placeholder for the pytest Config object
     # This will be set during pytest_configure hook to access CLI options
     _pytest_config = None
 
     # Common pytest fixtures to exclude from signature validation
-    PYTEST_FIXTURES = {
+    PYTEST_FIXTURES = frozenset({
         'request', 'tmp_path', 'tmp_path_factory', 'tmpdir', 'tmpdir_factory',
         'capsys', 'capfd', 'caplog', 'monkeypatch', 'pytestconfig',
         'cache', 'doctest_namespace', 'recwarn', 'record_property',
         'record_testsuite_property', 'record_xml_attribute'
-    }
+    })
 
     @staticmethod
     def export_strategies(format: str = "json") -> str:
@@ -74,7 +107,12 @@ class Strategy:
         Strategy._pytest_config = config
 
     @staticmethod
-    def _validate_signature(test_fn, argnames: Sequence[str], strategy_name: str) -> None:
+    def _validate_signature(
+        test_fn,
+        argnames: Sequence[str],
+        strategy_name: str,
+        expected: frozenset[str] | None = None,
+    ) -> None:
         """
         Validate that test function signature matches strategy argnames.
         
@@ -85,32 +123,33 @@ class Strategy:
             test_fn: The test function to validate
             argnames: Expected argument names from strategy
             strategy_name: Name of the strategy (for error messages)
+            expected: frozenset(argnames), if already computed
 
         Raises:
             ValueError: If signature doesn't match
         """
-        sig = inspect.signature(test_fn)
-        test_params = list(sig.parameters.keys())
+        params = Strategy._test_parameters(test_fn)[0]
+        if expected is None:
+            expected = frozenset(argnames)
+
+        # Common case: the test takes exactly the strategy's argnames, in order
+        if params == tuple(argnames) and expected.isdisjoint(Strategy.PYTEST_FIXTURES):
+            return
 
         # Remove pytest fixtures from comparison
         # A parameter is considered a fixture if:
         # 1. It's in the common pytest fixtures list, OR
         # 2. It's not in the strategy argnames (assumed to be a custom fixture)
-        actual_params = []
-        for p in test_params:
-            if p in Strategy.PYTEST_FIXTURES:
-                continue  # Skip known pytest fixtures
-            # If parameter is not in strategy argnames, assume it's a custom fixture
-            if p not in argnames:
-                continue  # Skip custom fixtures
-            actual_params.append(p)
-        
-        expected_params = list(argnames)
+        # so only argnames that aren't known fixtures are accepted
+        accept = expected - Strategy.PYTEST_FIXTURES
+        actual = frozenset(p for p in params if p in accept)
 
         # Check for mismatch
-        if set(expected_params) != set(actual_params):
-            missing = set(expected_params) - set(actual_params)
-            extra = set(actual_params) - set(expected_params)
+        if actual != expected:
+            actual_params = [p for p in params if p in actual]
+            expected_params = list(argnames)
+            missing = expected - actual
+            extra = actual - expected
 
             error_msg = f"Test function signature mismatch for strategy '{strategy_name}'!\n"
             error_msg += f"  Strategy provides: {expected_params}\n"
@@ -124,28 +163,128 @@ class Strategy:
             raise ValueError(error_msg)
 
     @staticmethod
-    def _is_dataclass_mode(test_fn, argnames: Sequence[str]) -> Tuple[bool, type | None]:
+    def _argnames_meta(argnames: tuple[str, ...]) -> tuple[str, frozenset[str]]:
+        """
+        Return the parametrize argument string and name set for argnames.
+
+        Both are cached per argnames tuple, as the same strategy usually
+        decorates many tests.
+
+        Args:
+            argnames: Argument names from strategy
+
+        Returns:
+            Tuple of (comma-separated argnames, frozenset of argnames)
+        """
+        meta = Strategy._arg_meta.get(argnames)
+        if meta is None:
+            meta = (",".join(argnames), frozenset(argnames))
+            Strategy._arg_meta[argnames] = meta
+        return meta
+
+    @staticmethod
+    def _is_dataclass_mode(test_fn, argnames: Sequence[str]) -> Tuple[bool, type | None, str | None]:
         """
         Detect if test function expects a single dataclass parameter.
 
+        Args:
+            test_fn: The test function to inspect
+            argnames: Argument names from strategy
+
         Returns:
-            Tuple of (is_dataclass_mode, dataclass_type)
+            Tuple of (is_dataclass_mode, dataclass_type, parameter_name)
         """
-        sig = inspect.signature(test_fn)
-        test_params = list(sig.parameters.keys())
+        # A dataclass only stands in for several argnames
+        if len(argnames) <= 1:
+            return False, None, None
+
+        params, annotations = Strategy._test_parameters(test_fn)
 
         # Remove fixtures
-        actual_params = [p for p in test_params if p not in Strategy.PYTEST_FIXTURES]
+        actual_params = [p for p in params if p not in Strategy.PYTEST_FIXTURES]
 
-        # Check if single parameter and multiple argnames (dataclass mode)
-        if len(actual_params) == 1 and len(argnames) > 1:
+        # Check if single parameter (dataclass mode)
+        if len(actual_params) == 1:
             # Check if parameter has dataclass type hint
-            param = sig.parameters[actual_params[0]]
-            if param.annotation != inspect.Parameter.empty:
-                if is_dataclass(param.annotation):
-                    return True, param.annotation
+            param_name = actual_params[0]
+            annotation = annotations.get(param_name)
+            if annotation is not None and is_dataclass(annotation):
+                return True, annotation, param_name
+
+        return False, None, None
+
+    @staticmethod
+    def _test_parameters(test_fn) -> tuple[tuple[str, ...], dict[str, Any]]:
+        """
+        Get a test function's parameter names and annotations.
+
+        Plain functions are read from their code object, which is much cheaper
+        than inspect.signature; anything else (wrapped functions, partials,
+        callables with __signature__) goes through inspect.signature. The result
+        is cached for functions that can be weakly referenced.
+
+        Args:
+            test_fn: The test function to inspect
+
+        Returns:
+            Tuple of (parameter names in signature order, annotations by name)
+        """
+        cached = None
+        # Callables that cannot be weakly referenced are simply not cached
+        with contextlib.suppress(TypeError):
+            cached = _test_parameters_cache.get(test_fn)
+        if cached is not None:
+            return cached
+
+        if (
+            type(test_fn) is types.FunctionType
+            and not hasattr(test_fn, "__wrapped__")
+            and not hasattr(test_fn, "__signature__")
+        ):
+            code = test_fn.__code__
+            names = code.co_varnames
+            npos = code.co_argcount
+            nkw = code.co_kwonlyargcount
+            # co_varnames lists positional, keyword-only, then *args and **kwargs
+            params = list(names[:npos])
+            extra = npos + nkw
+            if code.co_flags & inspect.CO_VARARGS:
+                params.append(names[extra])
+                extra += 1
+            params.extend(names[npos:npos + nkw])
+            if code.co_flags & inspect.CO_VARKEYWORDS:
+                params.append(names[extra])
+            result = (tuple(params), test_fn.__annotations__)
+        else:
+            sig = inspect.signature(test_fn)
+            result = (
+                tuple(sig.parameters),
+                {
+                    p.name: p.annotation for p in sig.parameters.values()
+                    if p.annotation is not inspect.Parameter.empty
+                },
+            )
+
+        with contextlib.suppress(TypeError):
+            _test_parameters_cache[test_fn] = result
+        return result
+
+    @staticmethod
+    def _dataclass_field_names(dataclass_type: type) -> tuple[str, ...]:
+        """
+        Return a dataclass's field names in declaration order, cached per class.
 
-        return False, None
+        Args:
+            dataclass_type: The dataclass type
+
+        Returns:
+            Tuple of field names
+        """
+        names = Strategy._dataclass_fields.get(dataclass_type)
+        if names is None:
+            names = tuple(f.name for f in fields(dataclass_type))
+            Strategy._dataclass_fields[dataclass_type] = names
+        return names
 
     @staticmethod
     def _convert_to_dataclass(samples: Sequence[tuple], argnames: Sequence[str], dataclass_type: type) -> list:
@@ -160,11 +299,39 @@ class Strategy:
         Returns:
             List of dataclass instances
 
+        Raises:
+            ValueError: If dataclass fields don't match argnames
+        """
+        key = (dataclass_type, tuple(argnames))
+        build = Strategy._dataclass_builders.get(key)
+        if build is None:
+            build = Strategy._dataclass_builder(dataclass_type, argnames)
+            Strategy._dataclass_builders[key] = build
+
+        return list(map(build, samples))
+
+    @staticmethod
+    def _dataclass_builder(dataclass_type: type, argnames: Sequence[str]) -> Callable[[tuple], Any]:
+        """
+        Generate a function building a dataclass instance from one sample tuple.
+
+        The function passes the sample items straight to the constructor in
+        field order, e.g. ``_T(sample[1], sample[0])``, so converting a sample
+        needs no intermediate dict or list.
+
+        Args:
+            dataclass_type: The dataclass type to instantiate
+            argnames: Argument names from strategy
+
+        Returns:
+            Function mapping a sample tuple to a dataclass instance
+
         Raises:
             ValueError: If dataclass fields don't match argnames
         """
         # Get dataclass field names
-        dc_fields = {f.name for f in fields(dataclass_type)}
+        dc_field_names = Strategy._dataclass_field_names(dataclass_type)
+        dc_fields = set(dc_field_names)
         strategy_fields = set(argnames)
 
         # Validate fields match
@@ -174,7 +341,7 @@ class Strategy:
 
             error_msg = f"Dataclass fields don't match strategy parameters!\n"
             error_msg += f"  Strategy provides: {list(argnames)}\n"
-            error_msg += f"  Dataclass expects: {list(dc_fields)}\n"
+            error_msg += f"  Dataclass expects: {list(dc_field_names)}\n"
 
             if missing:
                 error_msg += f"  Missing in dataclass: {list(missing)}\n"
@@ -183,20 +350,13 @@ class Strategy:
 
             raise ValueError(error_msg)
 
-        # Get field order from dataclass
-        dc_field_names = [f.name for f in fields(dataclass_type)]
-        
-        # Convert samples to dataclass instances
-        dataclass_samples = []
-        for sample in samples:
-            # Create dict mapping argnames to values
-            value_dict = dict(zip(argnames, sample))
-            # Reorder values to match dataclass field order
-            ordered_values = [value_dict[name] for name in dc_field_names]
-            # Create dataclass instance with ordered values
-            dataclass_samples.append(dataclass_type(*ordered_values))
+        # Only integer indices end up in the source; the type is bound as _T
+        positions = {name: i for i, name in enumerate(argnames)}
+        args = ", ".join(f"sample[{positions[name]}]" for name in dc_field_names)
+        namespace = {"_T": dataclass_type}
+        exec(f"def _build(sample):\n    return _T({args})\n", namespace)
 
-        return dataclass_samples
+        return namespace["_build"]
 
     @staticmethod
     def register(name: str):
@@ -217,9 +377,40 @@ class Strategy:
         def decorate(fn: Callable[[int], Tuple[Sequence[str], Sequence[Any]]]):
             # Store the factory function in the global registry
             Strategy._registry[name] = fn
+            Strategy._nsamples_by_keyword[name] = Strategy._accepts_nsamples_keyword(fn)
+
+            # Drop outputs cached for a previous factory with the same name
+            for cache in (Strategy._factory_cache, Strategy._samples_cache, Strategy._named_cache):
+                for key in [key for key in cache if key[0] == name]:
+                    del cache[key]
             return fn
         return decorate
 
+    @staticmethod
+    def _accepts_nsamples_keyword(fn: Callable) -> bool:
+        """
+        Check whether a factory can be called as fn(nsamples=...).
+
+        Args:
+            fn: The strategy factory function
+
+        Returns:
+            True if nsamples can be passed by keyword, False if it must be
+            passed positionally
+        """
+        try:
+            params = inspect.signature(fn).parameters.values()
+        except (TypeError, ValueError):
+            # No introspectable signature; keyword is the documented convention
+            return True
+
+        for p in params:
+            if p.kind == p.VAR_KEYWORD:
+                return True
+            if p.name == "nsamples" and p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY):
+                return True
+        return False
+
     @staticmethod
     def strategy(name: str, validate_signature: bool = True):
         """
@@ -259,14 +450,16 @@ class Strategy:
             @Strategy.register("legacy_strategy")
             def create_samples(nsamples):
                 return ("x", "y"), [(1, 2), (3, 4)]
+                # or column-wise: return ("x", "y"), {"x": [1, 3], "y": [2, 4]}
 
             @Strategy.strategy("legacy_strategy")
             def test_function(x, y):
                 # Test implementation
         """
         def decorate(test_fn):
-            # Validate that the strategy exists in the registry
-            if name not in Strategy._registry:
+            # Get the factory function for this strategy, validating that it exists
+            factory = Strategy._registry.get(name)
+            if factory is None:
                 available = list(Strategy._registry.keys())
                 raise ValueError(
                     f"Strategy '{name}' not found. "
@@ -280,74 +473,85 @@ class Strategy:
             vector_name = cfg.getoption("vector_name") if cfg else None
             vector_index = cfg.getoption("vector_index") if cfg else None
 
-            # Get the factory function for this strategy
-            factory = Strategy._registry[name]
-
-            # Refresh the random number generator seed
-            RNG.refresh_seed()
-
-            # Call factory function with keyword argument
-            try:
-                result = factory(nsamples=nsamples)
-            except TypeError as e:
-                # Try positional for backward compatibility
+            # Remember which strategy drives this test (used by the plugin's result cache)
+            test_fn._strategy_name = name
+
+            # Reuse the factory output when this strategy was already built for the
+            # same sample count and seed
+            cache_key = (name, nsamples, RNG.get_seed())
+            result = Strategy._factory_cache.get(cache_key)
+            samples_key = (*cache_key, vector_mode, vector_name, vector_index)
+            samples = Strategy._samples_cache.get(samples_key)
+
+            # Restart this strategy's random stream, so its samples depend only on
+            # the seed and strategy name, not on which tests were decorated before.
+            # Cached tuple output and already drawn Parameter samples draw nothing,
+            # so they need no restart
+            if result is None or (samples is None and isinstance(result, Parameter)):
+                RNG.refresh_seed(stream=name)
+
+            if result is None:
+                # Call factory function with keyword argument, or positionally
+                # for backward compatibility when its signature doesn't allow it
                 try:
-                    result = factory(nsamples)
-                except Exception as inner_e:
+                    if Strategy._nsamples_by_keyword.get(name, True):
+                        result = factory(nsamples=nsamples)
+                    else:
+                        result = factory(nsamples)
+                except TypeError as e:
                     raise ValueError(
                         f"Error calling strategy factory '{name}': {e}. "
                         f"Factory should accept 'nsamples' parameter."
-                    ) from inner_e
+                    ) from e
+                if not isinstance(result, Parameter):
+                    # Tuple output never changes, so normalize it once
+                    result = Strategy._normalize_tuple_result(result, name)
+                Strategy._factory_cache[cache_key] = result
 
             # Detect if result is a Parameter instance or tuple
             if isinstance(result, Parameter):
                 # NEW MODE: Parameter-based strategy
                 param = result
 
-                # Generate samples using Parameter's generate_vectors with CLI options
-                try:
-                    samples = param.generate_vectors(
-                        n=nsamples,
-                        mode=vector_mode,
-                        filter_by_name=vector_name,
-                        filter_by_index=vector_index
-                    )
-                except KeyError as e:
-                    # If filtering by name/index and vector doesn't exist, return empty samples
-                    # This allows CLI filtering to work gracefully across multiple strategies
-                    if vector_name or vector_index is not None:
-                        # Return empty list - pytest will skip this test
-                        samples = []
-                    else:
+                # Generate samples using Parameter's generate_vectors with CLI options,
+                # once per sample key
+                if samples is None:
+                    try:
+                        samples = param.generate_vectors(
+                            n=nsamples,
+                            mode=vector_mode,
+                            filter_by_name=vector_name,
+                            filter_by_index=vector_index
+                        )
+                    except KeyError as e:
+                        # If filtering by name/index and vector doesn't exist, return empty samples
+                        # This allows CLI filtering to work gracefully across multiple strategies
+                        if vector_name or vector_index is not None:
+                            # Return empty list - pytest will skip this test
+                            samples = []
+                        else:
+                            raise ValueError(
+                                f"Error generating samples for strategy '{name}': {e}"
+                            ) from e
+                    except Exception as e:
                         raise ValueError(
                             f"Error generating samples for strategy '{name}': {e}"
                         ) from e
-                except Exception as e:
-                    raise ValueError(
-                        f"Error generating samples for strategy '{name}': {e}"
-                    ) from e
+                    Strategy._samples_cache[samples_key] = samples
 
                 # Get argument names from Parameter
                 argnames = param.arg_names
 
-            else:
-                # LEGACY MODE: Tuple-based strategy (backward compatibility)
-                # Validate that factory returns the expected tuple format
-                if not isinstance(result, tuple) or len(result) != 2:
-                    raise ValueError(
-                        f"Strategy '{name}' must return either a Parameter instance "
-                        f"or a tuple (argnames, samples), got {type(result).__name__}"
-                    )
+                named_key = samples_key
 
-                # Unpack the result into parameter names and sample values
+            else:
+                # LEGACY MODE: Tuple-based strategy (backward compatibility),
+                # already validated and normalized when it was cached
                 argnames, samples = result
-
-                # Convert single string argname to tuple for consistency
-                if isinstance(argnames, str):
-                    argnames = (argnames,)
+                named_key = cache_key
 
             # Detect dataclass mode
-            is_dc_mode, dc_type = Strategy._is_dataclass_mode(test_fn, argnames)
+            is_dc_mode, dc_type, param_name = Strategy._is_dataclass_mode(test_fn, argnames)
 
             if is_dc_mode:
                 # DATACLASS MODE: Convert samples to dataclass instances
@@ -358,11 +562,6 @@ class Strategy:
                         f"Error converting samples to dataclass for strategy '{name}': {e}"
                     ) from e
 
-                # Get the single parameter name
-                sig = inspect.signature(test_fn)
-                test_params = [p for p in sig.parameters.keys() if p not in Strategy.PYTEST_FIXTURES]
-                param_name = test_params[0]
-
                 # Generate test IDs for dataclass mode
                 ids = Strategy._generate_dataclass_ids(dataclass_samples, dc_type)
 
@@ -372,24 +571,29 @@ class Strategy:
             else:
                 # NAMED PARAMETERS MODE: Standard behavior
 
+                argstr, argname_set = Strategy._argnames_meta(argnames)
+
                 # Validate signature if requested
                 if validate_signature:
                     try:
-                        Strategy._validate_signature(test_fn, argnames, name)
+                        Strategy._validate_signature(test_fn, argnames, name, argname_set)
                     except ValueError as e:
                         raise ValueError(
                             f"Signature validation failed for strategy '{name}': {e}"
                         ) from e
 
-                # Create comma-separated string of parameter names for pytest.mark.parametrize
-                argstr = ",".join(argnames)
-
-                # For single parameters, unwrap the tuples
-                if len(argnames) == 1:
-                    samples = [s[0] if isinstance(s, tuple) else s for s in samples]
+                named = Strategy._named_cache.get(named_key)
+                if named is None:
+                    # Generate test IDs for better test output readability;
+                    # single parameters also get their tuples unwrapped
+                    if len(argnames) == 1:
+                        samples, ids = Strategy._unwrap_single_samples(argnames[0], samples)
+                    else:
+                        ids = Strategy._generate_test_ids(argnames, samples)
 
-                # Generate test IDs for better test output readability
-                ids = Strategy._generate_test_ids(argnames, samples)
+                    Strategy._named_cache[named_key] = (argstr, samples, ids)
+                else:
+                    argstr, samples, ids = named
 
                 # Apply pytest parametrize decorator to the test function
                 # This will create multiple test instances, one for each sample
@@ -397,6 +601,74 @@ class Strategy:
 
         return decorate
 
+    @staticmethod
+    def _normalize_tuple_result(result: Any, strategy_name: str) -> tuple[tuple[str, ...], Sequence[Any]]:
+        """
+        Validate a tuple factory output and bring it to (argnames tuple, row samples).
+
+        Args:
+            result: Value returned by the strategy factory
+            strategy_name: Name of the strategy (for error messages)
+
+        Returns:
+            Tuple of (argnames, samples) with argnames as a tuple and samples as rows
+
+        Raises:
+            ValueError: If result is not an (argnames, samples) tuple or its
+                sample columns are inconsistent
+        """
+        # Validate that factory returns the expected tuple format
+        if not isinstance(result, tuple) or len(result) != 2:
+            raise ValueError(
+                f"Strategy '{strategy_name}' must return either a Parameter instance "
+                f"or a tuple (argnames, samples), got {type(result).__name__}"
+            )
+
+        # Unpack the result into parameter names and sample values
+        argnames, samples = result
+
+        # Convert single string argname to tuple for consistency
+        if isinstance(argnames, str):
+            argnames = (argnames,)
+
+        # Samples may also be given column-wise, as {argname: values}
+        if isinstance(samples, Mapping):
+            samples = Strategy._columns_to_rows(argnames, samples, strategy_name)
+
+        return argnames, samples
+
+    @staticmethod
+    def _columns_to_rows(argnames: Sequence[str], columns: Mapping[str, Sequence[Any]], strategy_name: str) -> list[tuple]:
+        """
+        Convert column-wise samples to the list of tuples parametrize expects.
+
+        Args:
+            argnames: Sequence of argument names, giving the tuple order
+            columns: Mapping of each argument name to its sequence of values
+            strategy_name: Name of the strategy (for error messages)
+
+        Returns:
+            List of sample tuples, one per row
+
+        Raises:
+            ValueError: If the columns don't match argnames or differ in length
+        """
+        if set(columns) != set(argnames):
+            raise ValueError(
+                f"Strategy '{strategy_name}' sample columns {sorted(columns)} "
+                f"don't match argnames {list(argnames)}"
+            )
+
+        ordered = [columns[arg_name] for arg_name in argnames]
+        lengths = {len(column) for column in ordered}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"Strategy '{strategy_name}' sample columns have different lengths: "
+                f"{dict(zip(argnames, map(len, ordered)))}"
+            )
+
+        return list(zip(*ordered))
+
     @staticmethod
     def _generate_test_ids(argnames: Sequence[str], samples: Sequence[Any], max_length: int = 80) -> list[str]:
         """
@@ -410,34 +682,96 @@ class Strategy:
         Returns:
             List of test ID strings
         """
-        ids = []
+        if len(argnames) == 1:
+            # Single parameter: format as "param_name=value"
+            return Strategy._unwrap_single_samples(argnames[0], samples, max_length)[1]
+
+        # Everything that does not depend on the sample is worked out once, so
+        # the loop below only reprs and slices
+        _repr = repr
+
+        # Multiple parameters: format as "param1=value1,param2=value2"
+        prefixes = [f"{arg_name}=" for arg_name in argnames]
+        needs_cut = Strategy._max_id_length(prefixes) > max_length
+
+        # Short samples are formatted in one call: when all values together
+        # repr to at most 20 characters, none of them needs cutting. The first
+        # sample over that budget switches to the per-value loop for good, so
+        # at most one sample is repr'd twice
+        nargs = len(prefixes)
+        format_id = ",".join(prefix + "{!r}" for prefix in prefixes).format
+        budget = min(sum(map(len, prefixes)) + nargs - 1 + 20, max_length)
+        try_format = True
 
+        ids = []
         for sample in samples:
-            if len(argnames) == 1:
-                # Single parameter: format as "param_name=value"
-                value = sample if not isinstance(sample, tuple) else sample[0]
-                val_str = repr(value)
-                if len(val_str) > max_length - len(argnames[0]) - 1:
-                    val_str = val_str[:max_length - len(argnames[0]) - 4] + "..."
-                ids.append(f"{argnames[0]}={val_str}")
-            else:
-                # Multiple parameters: format as "param1=value1,param2=value2"
-                parts = []
-                for arg_name, value in zip(argnames, sample):
-                    val_str = repr(value)
-                    # Limit individual value length
-                    if len(val_str) > 20:
-                        val_str = val_str[:17] + "..."
-                    parts.append(f"{arg_name}={val_str}")
-
-                full_id = ",".join(parts)
-                # Truncate if too long
-                if len(full_id) > max_length:
-                    full_id = full_id[:max_length - 3] + "..."
-                ids.append(full_id)
+            if try_format and len(sample) == nargs:
+                full_id = format_id(*sample)
+                if len(full_id) <= budget:
+                    ids.append(full_id)
+                    continue
+                try_format = False
+
+            parts = []
+            for prefix, value in zip(prefixes, sample):
+                val_str = _repr(value)
+                # Limit individual value length
+                if len(val_str) > 20:
+                    val_str = val_str[:17] + "..."
+                parts.append(prefix + val_str)
+
+            full_id = ",".join(parts)
+            # Truncate if too long
+            if needs_cut and len(full_id) > max_length:
+                full_id = full_id[:max_length - 3] + "..."
+            ids.append(full_id)
 
         return ids
 
+    @staticmethod
+    def _unwrap_single_samples(arg_name: str, samples: Sequence[Any], max_length: int = 80) -> tuple[list, list[str]]:
+        """
+        Unwrap single-parameter samples and build their test IDs in one pass.
+
+        Args:
+            arg_name: The single argument name
+            samples: Sequence of sample values (1-tuples or single values)
+            max_length: Maximum length for test ID (default: 80)
+
+        Returns:
+            Tuple of (unwrapped values, test ID strings)
+        """
+        _repr = repr
+        prefix = f"{arg_name}="
+        limit = max_length - len(prefix)
+        values = []
+        ids = []
+        for sample in samples:
+            if isinstance(sample, tuple):
+                sample = sample[0]
+            values.append(sample)
+            val_str = _repr(sample)
+            if len(val_str) > limit:
+                val_str = val_str[:limit - 3] + "..."
+            ids.append(prefix + val_str)
+        return values, ids
+
+    @staticmethod
+    def _max_id_length(prefixes: Sequence[str]) -> int:
+        """
+        Return the longest ID that "name=value" parts can join into.
+
+        Each value is cut to 20 characters, so IDs for few, short names
+        can never exceed max_length and need no length check.
+
+        Args:
+            prefixes: The "name=" prefix of every part
+
+        Returns:
+            Upper bound on the joined ID length
+        """
+        return sum(map(len, prefixes)) + 21 * len(prefixes) - 1
+
     @staticmethod
     def _generate_dataclass_ids(dataclass_samples: list, dc_type: type, max_length: int = 80) -> list[str]:
         """
@@ -451,19 +785,22 @@ class Strategy:
         Returns:
             List of test ID strings
         """
+        names = Strategy._dataclass_field_names(dc_type)
+        prefixes = [f"{name}=" for name in names]
+        needs_cut = Strategy._max_id_length(prefixes) > max_length
+
         ids = []
         for dc_instance in dataclass_samples:
             # Create readable ID from dataclass fields
             field_strs = []
-            for f in fields(dc_type):
-                val = getattr(dc_instance, f.name)
-                val_str = repr(val)
+            for name, prefix in zip(names, prefixes):
+                val_str = repr(getattr(dc_instance, name))
                 if len(val_str) > 20:
                     val_str = val_str[:17] + "..."
-                field_strs.append(f"{f.name}={val_str}")
+                field_strs.append(prefix + val_str)
 
             full_id = ",".join(field_strs)
-            if len(full_id) > max_length:
+            if needs_cut and len(full_id) > max_length:
                 full_id = full_id[:max_length - 3] + "..."
             ids.append(full_id)
 
@@ -2,6 +2,8 @@
 
 from typing import Any, Callable
 
+from .rng import _instance_attributes
+
 
 class TestArg:
     """
@@ -16,6 +18,17 @@ class TestArg:
     # Prevent pytest from collecting this class as a test
     __test__ = False
 
+    __slots__ = (
+        '_name',
+        '_rng_type',
+        '_description',
+        '_value',
+        '_directed_values',
+        '_always_include_directed',
+        '_validator',
+        '_generate',
+    )
+
     def __init__(
         self,
         name: str,
@@ -66,6 +79,9 @@ class TestArg:
                 f"TestArg '{name}' must have either a value, rng_type, or directed_values"
             )
 
+        # generate() specialized for this argument's mode
+        self._generate = self._bind_generate()
+
     def generate(self) -> Any:
         """
         Generate a single value.
@@ -77,19 +93,84 @@ class TestArg:
             ValueError: If no rng_type is available for generation
             ValueError: If generated value fails validation
         """
-        # If static value, return it
+        return self._generate()
+
+    def _bind_generate(self) -> Callable[[], Any]:
+        """
+        Build the function behind generate() for this argument.
+
+        Whether the value is static or random, and whether it is validated,
+        is fixed at construction, so it is decided once here rather than on
+        every call.
+
+        Returns:
+            Zero-argument function returning a generated or static value
+        """
+        name = self._name
+        validator = self._validator
+
         if self._value is not None:
-            return self._validate(self._value)
+            static_value = self._value
+
+            def draw():
+                return static_value
+        elif self._rng_type is not None:
+            draw = self._rng_type.generate
+        else:
+            def draw():
+                raise ValueError(
+                    f"Cannot generate value for '{name}' without rng_type"
+                )
+
+        if not validator:
+            return draw
+
+        def generate():
+            value = draw()
+            if not validator(value):
+                raise ValueError(
+                    f"Value {value!r} failed validation for argument '{name}'"
+                )
+            return value
+
+        return generate
+
+    def generate_batch(self, n: int) -> list[Any]:
+        """
+        Generate n values in one call.
+
+        Uses the RNG type's bulk generate_batch() when available, so the
+        per-value dispatch through generate() is paid once per batch.
+
+        Args:
+            n: Number of values to generate
+
+        Returns:
+            List of n generated or static values
+
+        Raises:
+            ValueError: If no rng_type is available for generation
+            ValueError: If a generated value fails validation
+        """
+        # Static value: validate once and repeat it
+        if self._value is not None:
+            return [self._validate(self._value)] * n
 
-        # If no RNG type, can't generate
         if self._rng_type is None:
             raise ValueError(
                 f"Cannot generate value for '{self._name}' without rng_type"
             )
 
-        # Generate and validate
-        value = self._rng_type.generate()
-        return self._validate(value)
+        generate_batch = getattr(self._rng_type, "generate_batch", None)
+        if generate_batch is None:
+            values = [self._rng_type.generate() for _ in range(n)]
+        else:
+            values = generate_batch(n)
+
+        if self._validator:
+            for value in values:
+                self._validate(value)
+        return values
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -108,15 +189,13 @@ class TestArg:
             
         if self._rng_type:
             data["rng_type"] = self._rng_type.__class__.__name__
-            # Add RNG specific details if available
-            if hasattr(self._rng_type, "__dict__"):
-                # Filter out private attributes and callables
-                rng_details = {
-                    k: str(v) for k, v in self._rng_type.__dict__.items() 
-                    if not k.startswith("_") and not callable(v)
-                }
-                if rng_details:
-                    data["rng_details"] = rng_details
+            # Add RNG specific details, filtering out private attributes and callables
+            rng_details = {
+                k: str(v) for k, v in _instance_attributes(self._rng_type).items()
+                if not k.startswith("_") and not callable(v)
+            }
+            if rng_details:
+                data["rng_details"] = rng_details
 
         return data
 
@@ -153,10 +232,9 @@ class TestArg:
                 samples.append(self._value)
             return samples
 
-        # Generate random samples
-        if self._rng_type:
-            for _ in range(n):
-                samples.append(self.generate())
+        # Generate random samples in one batch
+        if self._rng_type and n > 0:
+            samples.extend(self.generate_batch(n))
 
         return samples
 
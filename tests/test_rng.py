@@ -47,6 +47,31 @@ class TestRNGSeedManagement:
         RNG.seed(None)
         assert RNG.get_seed() == current_seed
 
+    def test_seed_none_reapplies_current(self):
+        """Test that seed(None) resets the random state to the current seed."""
+        RNG.seed(42)
+        values1 = [RNG.integer(0, 100) for _ in range(5)]
+
+        RNG.seed(None)
+        values2 = [RNG.integer(0, 100) for _ in range(5)]
+
+        assert values1 == values2
+
+    def test_seed_chosen_lazily(self, monkeypatch):
+        """Test that an unset seed is picked on first use and applied."""
+        monkeypatch.setattr(RNG, "_seed", None)
+        RNG.integer(0, 100)
+
+        RNG.seed(None)
+        seed = RNG.get_seed()
+        values1 = [RNG.integer(0, 100) for _ in range(5)]
+
+        RNG.seed(seed)
+        values2 = [RNG.integer(0, 100) for _ in range(5)]
+
+        assert isinstance(seed, int)
+        assert values1 == values2
+
     def test_seed_reproducibility(self):
         """Test that same seed produces same sequence."""
         RNG.seed(42)
@@ -77,6 +102,70 @@ class TestRNGSeedManagement:
 
         assert values1 == values2
 
+    def test_global_random_use_does_not_shift_sequence(self):
+        """Test that draws from the random module leave RNG's sequence alone."""
+        RNG.seed(42)
+        values1 = [RNG.integer(0, 100) for _ in range(5)]
+
+        RNG.seed(42)
+        random.random()
+        values2 = [RNG.integer(0, 100) for _ in range(5)]
+
+        assert values1 == values2
+
+    def test_seed_applies_to_random_module(self):
+        """Test that seeding also makes direct random module use reproducible."""
+        RNG.seed(42)
+        values1 = [random.random() for _ in range(5)]
+
+        RNG.seed(42)
+        values2 = [random.random() for _ in range(5)]
+
+        assert values1 == values2
+
+    def test_state_round_trip(self):
+        """Test that set_state() replays draws made after get_state()."""
+        RNG.seed(42)
+        state = RNG.get_state()
+        values1 = [RNG.integer(0, 100) for _ in range(5)] + [random.random()]
+
+        RNG.set_state(state)
+        values2 = [RNG.integer(0, 100) for _ in range(5)] + [random.random()]
+
+        assert values1 == values2
+
+    def test_refresh_seed_streams(self):
+        """Test that named streams are reproducible and independent of each other."""
+        RNG.seed(42)
+        RNG.refresh_seed(stream="a")
+        values_a = [RNG.integer(0, 1000) for _ in range(10)]
+        RNG.refresh_seed(stream="b")
+        values_b = [RNG.integer(0, 1000) for _ in range(10)]
+        RNG.refresh_seed(stream="a")
+
+        assert [RNG.integer(0, 1000) for _ in range(10)] == values_a
+        assert values_a != values_b
+
+    def test_refresh_seed_stream_leaves_random_module_alone(self):
+        """Test that restarting a named stream does not reseed the random module."""
+        RNG.seed(42)
+        random.random()
+        state = random.getstate()
+        RNG.refresh_seed(stream="a")
+
+        assert random.getstate() == state
+
+    def test_refresh_seed_stream_follows_seed_change(self):
+        """Test that a named stream restarts from the new seed after reseeding."""
+        RNG.seed(42)
+        RNG.refresh_seed(stream="a")
+        values1 = [RNG.integer(0, 1000) for _ in range(10)]
+
+        RNG.seed(99)
+        RNG.refresh_seed(stream="a")
+
+        assert [RNG.integer(0, 1000) for _ in range(10)] != values1
+
     def test_set_max_retries(self):
         """Test setting max retries for constrained generation."""
         RNG.set_max_retries(50)
@@ -373,6 +462,101 @@ class TestRNGString:
         assert len(unique_chars) > 5
 
 
+# ============================================================================
+# BATCH GENERATOR TESTS
+# ============================================================================
+
+class TestRNGBatchGenerators:
+    """Test RNG batch generation methods."""
+
+    def test_integers_in_range(self):
+        """Test that integers() returns size values within bounds."""
+        RNG.seed(42)
+        values = RNG.integers(-5, 5, 200)
+        assert len(values) == 200
+        assert all(-5 <= v <= 5 for v in values)
+
+    def test_integers_reproducible(self):
+        """Test that integers() repeats for the same seed."""
+        RNG.seed(3)
+        first = RNG.integers(0, 1000, 20)
+        RNG.seed(3)
+        assert RNG.integers(0, 1000, 20) == first
+
+    def test_integers_wide_range(self):
+        """Test that integers() stays in bounds and reproducible for spans above 2**32."""
+        RNG.seed(42)
+        values = RNG.integers(-2**40, 2**40, 50)
+        assert all(-2**40 <= v <= 2**40 for v in values)
+        RNG.seed(42)
+        assert RNG.integers(-2**40, 2**40, 50) == values
+
+    def test_floats_in_range(self):
+        """Test that floats() returns size values within bounds."""
+        RNG.seed(42)
+        values = RNG.floats(2.0, 3.0, 100)
+        assert len(values) == 100
+        assert all(2.0 <= v <= 3.0 for v in values)
+
+    def test_integers_with_predicate(self):
+        """Test that integers() only returns values passing the predicate."""
+        RNG.seed(42)
+        values = RNG.integers(0, 100, 50, predicate=lambda x: x % 2 == 0)
+        assert len(values) == 50
+        assert all(v % 2 == 0 for v in values)
+
+    def test_floats_with_predicate(self):
+        """Test that floats() only returns values passing the predicate."""
+        RNG.seed(42)
+        values = RNG.floats(0.0, 1.0, 30, predicate=lambda x: x > 0.5)
+        assert len(values) == 30
+        assert all(v > 0.5 for v in values)
+
+    def test_integers_impossible_predicate_raises_error(self):
+        """Test that integers() gives up on an unsatisfiable predicate."""
+        with pytest.raises(RNGValueError):
+            RNG.integers(0, 10, 5, predicate=lambda x: x > 100)
+
+    def test_booleans(self):
+        """Test that booleans() returns size booleans with the given bias."""
+        RNG.seed(42)
+        assert RNG.booleans(0) == []
+        assert set(RNG.booleans(100)) == {True, False}
+        assert RNG.booleans(20, true_probability=1.0) == [True] * 20
+        assert RNG.booleans(20, true_probability=0.0) == [False] * 20
+
+    def test_choices_from_items(self):
+        """Test that choices() picks only from the given items."""
+        RNG.seed(42)
+        values = RNG.choices(['a', 'b'], 50)
+        assert len(values) == 50
+        assert set(values) <= {'a', 'b'}
+
+    def test_choices_empty_raises_error(self):
+        """Test that choices() rejects an empty list."""
+        with pytest.raises(RNGValueError, match="cannot be empty"):
+            RNG.choices([], 5)
+
+    def test_strings_fixed_length(self):
+        """Test that strings() returns size strings of the given length."""
+        RNG.seed(42)
+        values = RNG.strings(20, length=6, charset="ab")
+        assert len(values) == 20
+        assert all(len(v) == 6 and set(v) <= {"a", "b"} for v in values)
+
+    def test_strings_variable_length(self):
+        """Test that strings() respects min_length and max_length."""
+        RNG.seed(42)
+        values = RNG.strings(50, min_length=2, max_length=5)
+        assert len(values) == 50
+        assert all(2 <= len(v) <= 5 for v in values)
+
+    def test_strings_negative_length_raises_error(self):
+        """Test that strings() rejects a negative length."""
+        with pytest.raises(ValueError, match="cannot be negative"):
+            RNG.strings(3, length=-1)
+
+
 # ============================================================================
 # WEIGHTED INTEGER TESTS
 # ============================================================================
@@ -435,6 +619,19 @@ class TestRNGWeightedInteger:
         values = [RNG.winteger(ranges) for _ in range(100)]
         assert len(values) == 100
 
+    def test_winteger_zero_weights_rejected(self):
+        """Test that ranges whose weights sum to zero raise ValueError."""
+        with pytest.raises(ValueError):
+            RNG.winteger({(0, 10): 0, (20, 30): 0})
+
+    def test_winteger_skips_zero_weight_ranges(self):
+        """Test that a zero-weight range is never chosen."""
+        RNG.seed(42)
+        ranges = {(0, 10): 1, (20, 30): 0}
+
+        values = [RNG.winteger(ranges) for _ in range(200)]
+        assert all(0 <= v <= 10 for v in values)
+
 
 # ============================================================================
 # WEIGHTED FLOAT TESTS
@@ -680,6 +877,16 @@ class TestRNGWeightedIntegerType:
             value = rng_type.generate()
             assert (0 <= value <= 10) or (20 <= value <= 30)
 
+    def test_rng_weighted_integer_type_matches_winteger(self):
+        """Test that precomputed weights draw the same sequence as RNG.winteger()."""
+        ranges = {(0, 10): 0.5, (20, 30): 0.3, (40, 50): 0.2}
+        rng_type = RNGWeightedInteger(ranges)
+
+        RNG.seed(9)
+        expected = [RNG.winteger(ranges) for _ in range(30)]
+        RNG.seed(9)
+        assert [rng_type.generate() for _ in range(30)] == expected
+
     def test_rng_weighted_integer_type_python_type(self):
         """Test RNGWeightedInteger.python_type property."""
         ranges = {(0, 10): 1.0}
@@ -713,6 +920,129 @@ class TestRNGWeightedFloatType:
         assert rng_type.python_type == float
 
 
+# ============================================================================
+# BATCH GENERATION TESTS
+# ============================================================================
+
+class TestRNGTypeBatchGeneration:
+    """Test generate_batch() on RNG type classes."""
+
+    def test_integer_batch_in_range(self):
+        """Test RNGInteger.generate_batch() stays within bounds."""
+        RNG.seed(42)
+        values = RNGInteger(1, 6).generate_batch(500)
+        assert len(values) == 500
+        assert all(isinstance(v, int) and 1 <= v <= 6 for v in values)
+        assert set(values) == {1, 2, 3, 4, 5, 6}
+
+    def test_integer_batch_with_predicate(self):
+        """Test RNGInteger.generate_batch() honours the predicate."""
+        RNG.seed(42)
+        values = RNGInteger(0, 100, predicate=lambda x: x % 2 == 0).generate_batch(50)
+        assert len(values) == 50
+        assert all(v % 2 == 0 for v in values)
+
+    def test_float_batch_with_predicate(self):
+        """Test RNGFloat.generate_batch() honours the predicate."""
+        RNG.seed(42)
+        values = RNGFloat(0.0, 1.0, predicate=lambda x: x > 0.9).generate_batch(30)
+        assert len(values) == 30
+        assert all(0.9 < v <= 1.0 for v in values)
+
+    def test_batch_impossible_predicate_raises_error(self):
+        """Test that an unsatisfiable predicate fails the batch like generate()."""
+        with pytest.raises(RNGValueError, match="No valid value found"):
+            RNGInteger(0, 10, predicate=lambda x: x > 100).generate_batch(5)
+
+    def test_integer_batch_huge_span(self):
+        """Test RNGInteger.generate_batch() with a span beyond float precision."""
+        RNG.seed(42)
+        values = RNGInteger(0, 2**64).generate_batch(10)
+        assert all(0 <= v <= 2**64 for v in values)
+
+    def test_integer_batch_huge_span_matches_generate(self):
+        """Test the wide-span batch draws the same sequence as generate()."""
+        rng = RNGInteger(-2**60, 2**60)
+        RNG.seed(7)
+        batch = rng.generate_batch(20)
+        RNG.seed(7)
+        assert batch == [rng.generate() for _ in range(20)]
+
+    def test_float_batch_in_range(self):
+        """Test RNGFloat.generate_batch() stays within bounds."""
+        RNG.seed(42)
+        values = RNGFloat(-1.0, 1.0).generate_batch(200)
+        assert len(values) == 200
+        assert all(isinstance(v, float) and -1.0 <= v <= 1.0 for v in values)
+
+    def test_boolean_batch(self):
+        """Test RNGBoolean.generate_batch() returns booleans."""
+        RNG.seed(42)
+        values = RNGBoolean(0.5).generate_batch(100)
+        assert all(isinstance(v, bool) for v in values)
+        assert set(values) == {True, False}
+
+    def test_fair_boolean_batch_is_balanced(self):
+        """Test that the single-draw fair coin batch is roughly 50/50."""
+        RNG.seed(42)
+        values = RNGBoolean().generate_batch(2000)
+        assert len(values) == 2000
+        assert 0.45 <= values.count(True) / len(values) <= 0.55
+        assert RNGBoolean().generate_batch(0) == []
+
+    def test_choice_batch(self):
+        """Test RNGChoice.generate_batch() only returns listed choices."""
+        RNG.seed(42)
+        values = RNGChoice(["a", "b", "c"]).generate_batch(100)
+        assert len(values) == 100
+        assert set(values) == {"a", "b", "c"}
+
+    def test_weighted_integer_batch(self):
+        """Test RNGWeightedInteger.generate_batch() draws from the weighted ranges."""
+        RNG.seed(42)
+        values = RNGWeightedInteger({(0, 9): 0.9, (100, 109): 0.1}).generate_batch(1000)
+        assert len(values) == 1000
+        assert all(0 <= v <= 9 or 100 <= v <= 109 for v in values)
+        assert 0.85 <= sum(v <= 9 for v in values) / len(values) <= 0.95
+
+    def test_weighted_float_batch(self):
+        """Test RNGWeightedFloat.generate_batch() draws from the weighted ranges."""
+        RNG.seed(42)
+        values = RNGWeightedFloat({(0.0, 1.0): 1, (5.0, 6.0): 1}).generate_batch(200)
+        assert len(values) == 200
+        assert all(0.0 <= v <= 1.0 or 5.0 <= v <= 6.0 for v in values)
+
+    def test_weighted_batch_with_predicate(self):
+        """Test weighted batches honour the predicate."""
+        RNG.seed(42)
+        rng_type = RNGWeightedInteger({(0, 50): 1, (51, 100): 1}, predicate=lambda x: x % 5 == 0)
+        assert all(v % 5 == 0 for v in rng_type.generate_batch(50))
+
+    def test_default_batch_uses_generate(self):
+        """Test types without a bulk path fall back to generate()."""
+        RNG.seed(42)
+        values = RNGString(length=5).generate_batch(10)
+        assert len(values) == 10
+        assert all(len(v) == 5 for v in values)
+
+    def test_batch_zero_count(self):
+        """Test generating an empty batch."""
+        assert RNGInteger(0, 10).generate_batch(0) == []
+        assert RNGFloat(0.0, 1.0).generate_batch(0) == []
+
+    def test_batch_reproducibility(self):
+        """Test that batches are reproducible with the same seed."""
+        rng_type = RNGInteger(0, 1000)
+
+        RNG.seed(42)
+        values1 = rng_type.generate_batch(20)
+
+        RNG.seed(42)
+        values2 = rng_type.generate_batch(20)
+
+        assert values1 == values2
+
+
 # ============================================================================
 # BASE CLASS TESTS
 # ============================================================================
@@ -730,6 +1060,34 @@ class TestRNGTypeBase:
         with pytest.raises(NotImplementedError):
             _ = rng_type.python_type
 
+    @pytest.mark.parametrize("rng_type", [
+        RNGInteger(0, 10),
+        RNGFloat(0.0, 1.0),
+        RNGBoolean(),
+        RNGChoice([1, 2]),
+        RNGString(length=3),
+        RNGWeightedInteger({(0, 10): 1}),
+        RNGWeightedFloat({(0.0, 1.0): 1}),
+    ])
+    def test_builtin_types_use_slots(self, rng_type):
+        """Test that built-in RNG types store their state in slots, not a __dict__."""
+        assert not hasattr(rng_type, "__dict__")
+
+        with pytest.raises(AttributeError):
+            rng_type.unknown_attribute = 1
+
+    def test_subclass_without_slots_keeps_dict(self):
+        """Test that user-defined RNG types can still set arbitrary attributes."""
+        class Constant(RNGType):
+            def __init__(self, value):
+                self.value = value
+
+            def generate(self):
+                return self.value
+
+        assert Constant(3).generate() == 3
+        assert vars(Constant(3)) == {"value": 3}
+
 
 # ============================================================================
 # EDGE CASES AND ERROR HANDLING
@@ -27,6 +27,12 @@ class TestMetadataExport:
         assert data2["rng_details"]["min"] == "0"
         assert data2["rng_details"]["max"] == "10"
 
+    def test_test_arg_to_dict_rng_details_from_slots(self):
+        """Test that rng_details lists public slot attributes, skipping callables and private ones"""
+        data = TestArg("status", rng_type=RNGEnum(Status, weights={Status.ACTIVE: 1})).to_dict()
+        assert data["rng_type"] == "RNGEnum"
+        assert set(data["rng_details"]) == {"weights", "predicate"}
+
     def test_parameter_to_dict(self):
         """Test Parameter.to_dict() serialization"""
         param = Parameter(
@@ -6,7 +6,7 @@ sample generation with different modes, CLI support, constraint handling, and in
 """
 
 import pytest
-from pytest_strategy import RNGInteger, RNGFloat, RNGChoice, RNGBoolean
+from pytest_strategy import RNG, RNGInteger, RNGFloat, RNGChoice, RNGBoolean
 from pytest_strategy.test_args import TestArg
 from pytest_strategy.parameters import Parameter
 
@@ -77,12 +77,36 @@ class TestParameterInitialization:
                 directed_vectors={"invalid": (1, 2, 3)}
             )
 
+    def test_initialization_reports_all_invalid_directed_vectors(self):
+        """Test that every wrong-length directed vector is named in the error."""
+        arg1 = TestArg("x", rng_type=RNGInteger(0, 10))
+        arg2 = TestArg("y", rng_type=RNGInteger(0, 10))
+
+        with pytest.raises(ValueError) as exc_info:
+            Parameter(
+                arg1, arg2,
+                directed_vectors={"short": (1,), "ok": (1, 2), "long": (1, 2, 3)}
+            )
+
+        message = str(exc_info.value)
+        assert "'short' has 1 values" in message
+        assert "'long' has 3 values" in message
+        assert "'ok'" not in message
+
     def test_initialization_empty_args(self):
         """Test creating Parameter with no args."""
         param = Parameter()
         assert param.num_args == 0
         assert param.arg_names == ()
 
+    def test_parameter_uses_slots(self):
+        """Test that Parameter stores its state in slots, not a __dict__."""
+        param = Parameter(TestArg("x", rng_type=RNGInteger(0, 10)))
+        assert not hasattr(param, "__dict__")
+
+        with pytest.raises(AttributeError):
+            param.unknown_attribute = 1
+
 
 # ============================================================================
 # DIRECTED VECTOR MANAGEMENT TESTS
@@ -192,6 +216,17 @@ class TestParameterVectorGeneration:
         with pytest.raises(ValueError, match="Could not generate valid vector"):
             param.generate_vector()
 
+    def test_generate_vector_keeps_argument_order(self):
+        """Test that the generated vector follows test_args order and arity."""
+        param = Parameter(
+            TestArg("a", value=1),
+            TestArg("b", rng_type=RNGInteger(5, 5)),
+            TestArg("c", value="z")
+        )
+
+        assert param.generate_vector() == (1, 5, "z")
+        assert Parameter().generate_vector() == ()
+
 
 # ============================================================================
 # SAMPLE GENERATION TESTS
@@ -273,6 +308,154 @@ class TestParameterSampleGeneration:
         samples = param.generate_vectors(0, mode="random_only")
         assert samples == []
 
+    def test_generate_samples_respects_constraints(self):
+        """Test that batch-generated vectors all satisfy constraints."""
+        param = Parameter(
+            TestArg("min", rng_type=RNGInteger(0, 100)),
+            TestArg("max", rng_type=RNGInteger(0, 100)),
+            vector_constraints=[lambda v: v[0] < v[1]]
+        )
+
+        samples = param.generate_vectors(50, mode="random_only")
+        assert len(samples) == 50
+        assert all(v[0] < v[1] for v in samples)
+
+    def test_generate_samples_multiple_constraints(self):
+        """Test that batch filtering applies every constraint."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 20)),
+            TestArg("y", rng_type=RNGInteger(0, 20)),
+            vector_constraints=[
+                lambda v: v[0] < v[1],
+                lambda v: v[0] + v[1] <= 20,
+            ]
+        )
+
+        samples = param.generate_vectors(30, mode="random_only")
+        assert len(samples) == 30
+        assert all(v[0] < v[1] and v[0] + v[1] <= 20 for v in samples)
+
+    def test_generate_samples_with_static_arg(self):
+        """Test that static arguments are repeated in every vector."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            TestArg("mode", value="fast")
+        )
+
+        samples = param.generate_vectors(5, mode="random_only")
+        assert len(samples) == 5
+        assert all(v[1] == "fast" for v in samples)
+
+    def test_generate_samples_follows_rng_type_changes(self):
+        """Test that changing a TestArg's RNG type between calls takes effect."""
+        arg = TestArg("x", rng_type=RNGInteger(1, 10))
+        param = Parameter(arg)
+
+        RNG.seed(11)
+        param.generate_vectors(5, mode="random_only")
+        arg.rng_type.min, arg.rng_type.max = 500, 1000
+
+        RNG.seed(11)
+        samples = param.generate_vectors(5, mode="random_only")
+        assert all(500 <= v[0] <= 1000 for v in samples)
+
+    def test_generate_samples_sees_direct_dict_changes(self):
+        """Test that vectors added straight to directed_vectors are generated."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            directed_vectors={"a": (0,)}
+        )
+        param.generate_vectors(1, mode="all")
+        param.directed_vectors["b"] = (99,)
+
+        assert param.generate_vectors(1, mode="all")[:2] == [(0,), (99,)]
+        assert param.generate_vectors(0, mode="directed_only") == [(0,), (99,)]
+
+    def test_generate_samples_lazy(self):
+        """Test that lazy=True returns an iterator over the same layout."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            directed_vectors={"zero": (0,), "ten": (10,)}
+        )
+
+        samples = param.generate_vectors(3, mode="all", lazy=True)
+        assert not isinstance(samples, list)
+        samples = list(samples)
+        assert samples[:2] == [(0,), (10,)]
+        assert len(samples) == 5
+
+        directed = param.generate_vectors(0, mode="directed_only", lazy=True)
+        assert list(directed) == [(0,), (10,)]
+
+    def test_generate_samples_dedupe(self):
+        """Test that dedupe skips draws repeating directed or earlier vectors."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 20)),
+            directed_vectors={"zero": (0,)}
+        )
+
+        samples = param.generate_vectors(15, mode="all", dedupe=True)
+        assert samples[0] == (0,)
+        assert len(samples) == 16
+        assert len(set(samples)) == len(samples)
+
+    def test_generate_samples_dedupe_exhausted_space(self):
+        """Test that dedupe returns fewer vectors when the space runs out."""
+        param = Parameter(TestArg("flag", rng_type=RNGBoolean()))
+
+        samples = param.generate_vectors(10, mode="random_only", dedupe=True)
+        assert sorted(samples) == [(False,), (True,)]
+
+
+# ============================================================================
+# COMBINATION TESTS
+# ============================================================================
+
+class TestParameterCombinations:
+    """Test exhaustive combination generation."""
+
+    def test_combinations_cartesian_product(self):
+        """Test that every combination of finite domains is produced."""
+        param = Parameter(
+            TestArg("mode", rng_type=RNGChoice(["fast", "slow"])),
+            TestArg("enabled", rng_type=RNGBoolean()),
+        )
+
+        vectors = param.generate_combinations()
+        assert vectors == [
+            ("fast", False), ("fast", True),
+            ("slow", False), ("slow", True),
+        ]
+
+    def test_combinations_with_constraints(self):
+        """Test that constraints filter the product."""
+        param = Parameter(
+            TestArg("a", rng_type=RNGChoice([1, 2, 3, 4])),
+            TestArg("b", rng_type=RNGChoice([1, 2, 3, 4])),
+            vector_constraints=[lambda v: v[0] < v[1]]
+        )
+
+        vectors = param.generate_combinations()
+        assert len(vectors) == 6
+        assert all(a < b for a, b in vectors)
+
+    def test_combinations_static_and_directed_values(self):
+        """Test static values and directed values are enumerated."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 100), directed_values=[0, 100]),
+            TestArg("label", value="fixed"),
+        )
+
+        vectors = param.generate_combinations()
+        assert vectors == [(0, "fixed"), (100, "fixed")]
+
+    def test_combinations_unbounded_arg_raises_error(self):
+        """Test that an argument without a finite domain raises error."""
+        param = Parameter(TestArg("x", rng_type=RNGInteger(0, 100)))
+
+        with pytest.raises(ValueError, match="no finite set of values"):
+            param.generate_combinations()
+
 
 # ============================================================================
 # CLI SUPPORT TESTS
@@ -358,6 +541,19 @@ class TestParameterCLISupport:
         vector = param.get_vector_by_index(0)
         assert vector == (0,)
 
+    def test_get_vector_by_index_after_removal(self):
+        """Test that indices shift after a directed vector is removed."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            directed_vectors={"zero": (0,), "five": (5,), "ten": (10,)}
+        )
+        assert param.get_vector_by_index(1) == (5,)
+
+        param.remove_directed_vector("zero")
+        assert param.get_vector_by_index(1) == (10,)
+        with pytest.raises(IndexError):
+            param.get_vector_by_index(2)
+
     def test_list_vector_names(self):
         """Test list_vector_names method."""
         arg = TestArg("x", rng_type=RNGInteger(0, 10))
@@ -415,6 +611,93 @@ class TestParameterConstraints:
         param.clear_constraints()
         assert len(param.vector_constraints) == 0
 
+    def test_constraint_added_after_generation(self):
+        """Test that constraints added later apply to new vectors."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            vector_constraints=[lambda v: v[0] >= 2]
+        )
+        param.generate_vectors(5, mode="random_only")
+
+        param.add_constraint(lambda v: v[0] % 2 == 0)
+        samples = param.generate_vectors(20, mode="random_only")
+        assert all(v[0] >= 2 and v[0] % 2 == 0 for v in samples)
+
+        param.clear_constraints()
+        assert param._validate_vector((1,))
+
+    def test_ordering_constraint_is_met_by_swapping(self):
+        """Test that v[i] < v[j] on interchangeable args needs no retries."""
+        param = Parameter(
+            TestArg("low", rng_type=RNGFloat(0.0, 1.0)),
+            TestArg("high", rng_type=RNGFloat(0.0, 1.0)),
+            vector_constraints=[lambda v: v[0] < v[1]],
+            max_retries=1
+        )
+
+        assert param._ordering_pairs() == ((0, 1),)
+        for _ in range(100):
+            low, high = param.generate_vector()
+            assert 0.0 <= low < high <= 1.0
+
+        samples = param.generate_vectors(100, mode="random_only")
+        assert all(low < high for low, high in samples)
+
+    def test_ordering_constraint_greater_than(self):
+        """Test that v[i] > v[j] is recognized with the indices reversed."""
+        param = Parameter(
+            TestArg("a", rng_type=RNGInteger(0, 10)),
+            TestArg("b", rng_type=RNGInteger(0, 10)),
+            vector_constraints=[lambda v: v[0] > v[1]]
+        )
+
+        assert param._ordering_pairs() == ((1, 0),)
+
+    def test_ordering_constraint_needs_interchangeable_args(self):
+        """Test that args with different RNG settings are never swapped."""
+        param = Parameter(
+            TestArg("min", rng_type=RNGInteger(0, 50)),
+            TestArg("max", rng_type=RNGInteger(40, 100)),
+            vector_constraints=[lambda v: v[0] < v[1]]
+        )
+
+        assert param._ordering_pairs() == ()
+        for _ in range(20):
+            low, high = param.generate_vector()
+            assert 0 <= low <= 50 and 40 <= high <= 100 and low < high
+
+    def test_ordering_constraint_ignores_other_constraints(self):
+        """Test that compound constraints fall back to rejection sampling."""
+        param = Parameter(
+            TestArg("a", rng_type=RNGInteger(0, 10)),
+            TestArg("b", rng_type=RNGInteger(0, 10)),
+            vector_constraints=[lambda v: v[0] < v[1] and v[0] > 2]
+        )
+
+        assert param._ordering_pairs() == ()
+
+    def test_batch_impossible_constraints_raises_error(self):
+        """Test that batch generation gives up after max_retries rounds."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            vector_constraints=[lambda v: v[0] > 100],
+            max_retries=5
+        )
+
+        with pytest.raises(ValueError, match="after 5 attempts"):
+            param.generate_vectors(10, mode="random_only")
+
+    def test_batch_refills_rejected_rows(self):
+        """Test that rejected rows are redrawn until n vectors pass."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 100)),
+            vector_constraints=[lambda v: v[0] % 10 == 0]
+        )
+
+        samples = param.generate_vectors(50, mode="random_only")
+        assert len(samples) == 50
+        assert all(v[0] % 10 == 0 for v in samples)
+
 
 # ============================================================================
 # INTROSPECTION TESTS
@@ -451,6 +734,34 @@ class TestParameterIntrospection:
         
         assert param.vector_names == ["a", "b", "c"]
 
+    def test_vector_names_track_add_and_remove(self):
+        """Test vector_names reflects changes after it was first read."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            directed_vectors={"a": (1,)}
+        )
+        assert param.vector_names == ["a"]
+
+        param.add_directed_vector("b", (2,))
+        assert param.vector_names == ["a", "b"]
+
+        param.remove_directed_vector("a")
+        assert param.vector_names == ["b"]
+
+    def test_vector_names_track_direct_dict_changes(self):
+        """Test that index lookups agree with names after editing the dict directly."""
+        param = Parameter(
+            TestArg("x", rng_type=RNGInteger(0, 10)),
+            directed_vectors={"a": (1,), "b": (2,)}
+        )
+        assert param.get_vector_by_index(1) == (2,)
+
+        del param.directed_vectors["a"]
+        param.directed_vectors["c"] = (3,)
+
+        assert param.vector_names == param.list_vector_names() == ["b", "c"]
+        assert param.get_vector_by_index(1) == param.get_vector_by_name("c") == (3,)
+
     def test_num_args_property(self):
         """Test num_args property."""
         arg1 = TestArg("x", rng_type=RNGInteger(0, 10))
@@ -486,6 +797,14 @@ class TestParameterIntrospection:
         with pytest.raises(KeyError, match="No argument named"):
             param.get_arg("nonexistent")
 
+    def test_get_arg_duplicate_name_returns_first(self):
+        """Test that get_arg returns the first argument on duplicate names."""
+        first = TestArg("x", rng_type=RNGInteger(0, 10))
+        second = TestArg("x", rng_type=RNGInteger(20, 30))
+        param = Parameter(first, second)
+
+        assert param.get_arg("x") is first
+
 
 # ============================================================================
 # STRING REPRESENTATION TESTS
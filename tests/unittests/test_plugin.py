@@ -0,0 +1,389 @@
+"""
+Unit tests for the plugin module.
+
+Tests the PytestStrategyPlugin helpers used for strategy file auto-discovery.
+"""
+
+import hashlib
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_strategy.plugin import PASSED_VECTORS_CACHE_KEY, SCAN_HEAD_BYTES, PytestStrategyPlugin
+
+REGISTRATION = "@Strategy.register('example')\ndef example(nsamples):\n    pass\n"
+
+
+# ============================================================================
+# DISCOVERY TESTS
+# ============================================================================
+
+class TestStrategyFileDiscovery:
+    """Test discovery of strategy definition files."""
+
+    def test_discovers_matching_file_names(self, tmp_path):
+        """Test that all strategy file name patterns are found."""
+        for name in ["strategies.py", "strategy.py", "api_strategies.py", "db_strategy.py"]:
+            (tmp_path / name).write_text(REGISTRATION)
+        (tmp_path / "helpers.py").write_text(REGISTRATION)
+
+        found = PytestStrategyPlugin()._discover_strategy_files([tmp_path])
+        assert sorted(p.name for p in found) == [
+            "api_strategies.py", "db_strategy.py", "strategies.py", "strategy.py"
+        ]
+
+    def test_skips_suffix_files_without_registration(self, tmp_path):
+        """Test that *_strategies.py files without @Strategy.register are skipped."""
+        (tmp_path / "api_strategies.py").write_text("VALUE = 1\n")
+
+        assert PytestStrategyPlugin()._discover_strategy_files([tmp_path]) == []
+
+    def test_canonical_names_are_not_read(self, tmp_path):
+        """Test that strategies.py is taken without checking its contents."""
+        (tmp_path / "strategies.py").write_text("VALUE = 1\n")
+        scan_cache = {}
+
+        found = PytestStrategyPlugin()._discover_strategy_files([tmp_path], scan_cache)
+        assert found == [tmp_path / "strategies.py"]
+        assert scan_cache == {}
+
+    def test_prunes_hidden_and_cache_directories(self, tmp_path):
+        """Test that hidden and __pycache__ directories are not searched."""
+        for directory in [".venv", "__pycache__", "nested"]:
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / "strategies.py").write_text(REGISTRATION)
+
+        found = PytestStrategyPlugin()._discover_strategy_files([tmp_path])
+        assert found == [tmp_path / "nested" / "strategies.py"]
+
+    def test_prunes_excluded_directories(self, tmp_path):
+        """Test that default and custom excluded directories are skipped."""
+        for directory in ["node_modules", "vendor", "nested"]:
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / "strategies.py").write_text(REGISTRATION)
+
+        plugin = PytestStrategyPlugin()
+        found = plugin._discover_strategy_files([tmp_path])
+        assert sorted(p.parent.name for p in found) == ["nested", "vendor"]
+
+        found = plugin._discover_strategy_files([tmp_path], exclude_dirs=frozenset({"vendor"}))
+        assert sorted(p.parent.name for p in found) == ["nested", "node_modules"]
+
+    def test_overlapping_search_paths_report_once(self, tmp_path):
+        """Test that a file reachable from two search paths is returned once."""
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "strategies.py").write_text(REGISTRATION)
+
+        found = PytestStrategyPlugin()._discover_strategy_files(
+            [tmp_path, tmp_path / "nested"]
+        )
+        assert found == [tmp_path / "nested" / "strategies.py"]
+
+    def test_equivalent_search_paths_report_once(self, tmp_path):
+        """Test that differently spelled paths to one directory dedupe."""
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "strategies.py").write_text(REGISTRATION)
+
+        found = PytestStrategyPlugin()._discover_strategy_files(
+            [tmp_path, tmp_path / "nested" / ".."]
+        )
+        assert found == [tmp_path / "strategies.py"]
+
+
+# ============================================================================
+# REGISTRATION SCAN CACHE TESTS
+# ============================================================================
+
+class TestRegistrationScanCache:
+    """Test caching of strategy registration scans."""
+
+    def test_scan_result_is_stored(self, tmp_path):
+        """Test that a scanned file is recorded with its mtime and size."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text(REGISTRATION)
+        scan_cache = {}
+
+        assert PytestStrategyPlugin()._contains_strategy_registration(file_path, scan_cache)
+        stat = file_path.stat()
+        assert scan_cache[str(file_path)] == [stat.st_mtime_ns, stat.st_size, True]
+
+    def test_unchanged_file_uses_cached_result(self, tmp_path):
+        """Test that a matching cache entry is returned without rereading."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text("# Helpers only\nVALUE = 1\n")
+        stat = file_path.stat()
+        scan_cache = {str(file_path): [stat.st_mtime_ns, stat.st_size, True]}
+
+        assert PytestStrategyPlugin()._contains_strategy_registration(file_path, scan_cache)
+
+    def test_changed_file_is_rescanned(self, tmp_path):
+        """Test that a stale cache entry is replaced by a fresh scan."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text("# Helpers only\nVALUE = 1\n")
+        scan_cache = {str(file_path): [0, 0, True]}
+
+        assert not PytestStrategyPlugin()._contains_strategy_registration(file_path, scan_cache)
+        assert scan_cache[str(file_path)][2] is False
+
+
+# ============================================================================
+# REGISTRATION DETECTION TESTS
+# ============================================================================
+
+class TestRegistrationDetection:
+    """Test detection of strategy registrations in file contents."""
+
+    def test_detects_lowercase_decorator(self, tmp_path):
+        """Test that @strategy.register is detected too."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text("@strategy.register('x')\ndef x(nsamples):\n    pass\n")
+
+        assert PytestStrategyPlugin()._contains_strategy_registration(file_path)
+
+    def test_detects_decorator_after_non_ascii_text(self, tmp_path):
+        """Test that non-ASCII content does not hide a registration."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text("# résumé ✓\n" + REGISTRATION, encoding="utf-8")
+
+        assert PytestStrategyPlugin()._contains_strategy_registration(file_path)
+
+    def test_detects_decorator_past_the_head(self, tmp_path):
+        """Test that a registration after SCAN_HEAD_BYTES is still found."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text("#" * (SCAN_HEAD_BYTES + 10) + "\n" + REGISTRATION)
+
+        assert PytestStrategyPlugin()._contains_strategy_registration(file_path)
+
+    def test_detects_decorator_split_across_the_head(self, tmp_path):
+        """Test that a registration straddling the head boundary is found."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text("#" * (SCAN_HEAD_BYTES - 5) + "\n" + REGISTRATION)
+
+        assert PytestStrategyPlugin()._contains_strategy_registration(file_path)
+
+    def test_missing_file_is_not_a_strategy_file(self, tmp_path):
+        """Test that unreadable paths are reported as not containing strategies."""
+        assert not PytestStrategyPlugin()._contains_strategy_registration(tmp_path / "gone.py")
+
+    def test_oversized_file_is_not_read(self, tmp_path):
+        """Test that files above max_scan_bytes are skipped."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text(REGISTRATION)
+        size = file_path.stat().st_size
+
+        plugin = PytestStrategyPlugin()
+        assert plugin._contains_strategy_registration(file_path, max_scan_bytes=size)
+        assert not plugin._contains_strategy_registration(file_path, max_scan_bytes=size - 1)
+
+    def test_tiny_file_is_not_a_strategy_file(self, tmp_path):
+        """Test that files too small to hold a registration are skipped."""
+        file_path = tmp_path / "strategies.py"
+        file_path.write_text("@Strategy.regist")
+
+        assert not PytestStrategyPlugin()._contains_strategy_registration(file_path)
+
+
+# ============================================================================
+# MODULE NAMING TESTS
+# ============================================================================
+
+class TestModuleNames:
+    """Test module names given to loaded strategy files."""
+
+    class _Config:
+        def __init__(self, rootpath):
+            self.rootpath = rootpath
+
+    def test_module_name_under_rootpath(self, tmp_path):
+        """Test that files under rootpath are named after their relative path."""
+        config = self._Config(tmp_path)
+        name = PytestStrategyPlugin()._create_module_name(tmp_path / "pkg" / "strategies.py", config)
+        assert name == "pytest_strategies_discovered.pkg.strategies"
+
+    def test_module_name_outside_rootpath_is_stable(self, tmp_path):
+        """Test that the fallback name is a deterministic path digest."""
+        config = self._Config(tmp_path / "root")
+        file_path = tmp_path / "elsewhere" / "strategies.py"
+        digest = hashlib.blake2b(str(file_path).encode(), digest_size=8).hexdigest()
+
+        name = PytestStrategyPlugin()._create_module_name(file_path, config)
+        assert name == f"pytest_strategies_discovered.strategies_{digest}"
+
+
+# ============================================================================
+# LOADING TESTS
+# ============================================================================
+
+class TestStrategyFileLoading:
+    """Test importing discovered strategy files."""
+
+    @staticmethod
+    def _config(rootpath, verbose=0):
+        return SimpleNamespace(rootpath=rootpath, option=SimpleNamespace(verbose=verbose))
+
+    def test_loaded_modules_are_registered(self, tmp_path):
+        """Test that every loaded file is importable from sys.modules."""
+        (tmp_path / "loading_ok_strategies.py").write_text("VALUE = 1\n")
+        config = self._config(tmp_path)
+        plugin = PytestStrategyPlugin()
+
+        plugin._load_strategy_files([tmp_path / "loading_ok_strategies.py"], config)
+        name = "pytest_strategies_discovered.loading_ok_strategies"
+        try:
+            assert sys.modules[name].VALUE == 1
+            assert plugin.discovered_files == [tmp_path / "loading_ok_strategies.py"]
+        finally:
+            sys.modules.pop(name, None)
+
+    def test_failing_module_is_unregistered(self, tmp_path):
+        """Test that a file raising on import is dropped without stopping the rest."""
+        (tmp_path / "loading_bad_strategies.py").write_text("raise RuntimeError('boom')\n")
+        (tmp_path / "loading_good_strategies.py").write_text("VALUE = 2\n")
+        files = [tmp_path / "loading_bad_strategies.py", tmp_path / "loading_good_strategies.py"]
+        plugin = PytestStrategyPlugin()
+
+        plugin._load_strategy_files(files, self._config(tmp_path))
+        try:
+            assert "pytest_strategies_discovered.loading_bad_strategies" not in sys.modules
+            assert plugin.discovered_files == [files[1]]
+        finally:
+            sys.modules.pop("pytest_strategies_discovered.loading_good_strategies", None)
+
+    def test_verbose_log_uses_relative_names(self, tmp_path, capsys):
+        """Test that loaded files are logged relative to rootpath when under it."""
+        (tmp_path / "root").mkdir()
+        (tmp_path / "other").mkdir()
+        inside = tmp_path / "root" / "loading_inside_strategies.py"
+        outside = tmp_path / "other" / "loading_outside_strategies.py"
+        inside.write_text("VALUE = 3\n")
+        outside.write_text("VALUE = 4\n")
+        plugin = PytestStrategyPlugin()
+
+        plugin._load_strategy_files([inside, outside], self._config(tmp_path / "root", verbose=2))
+        try:
+            out = capsys.readouterr().out
+            assert "Loaded loading_inside_strategies.py\n" in out
+            assert f"Loaded {outside}\n" in out
+            assert plugin.discovered_files == [inside, outside]
+        finally:
+            for name in list(sys.modules):
+                if "loading_inside" in name or "loading_outside" in name:
+                    del sys.modules[name]
+
+
+# ============================================================================
+# PASSED-VECTOR CACHE TESTS
+# ============================================================================
+
+class TestPassedVectorCache:
+    """Test the --strategy-cache bookkeeping."""
+
+    def test_missing_cacheprovider_disables_cache(self):
+        """Test that a config without .cache (-p no:cacheprovider) is tolerated."""
+        config = SimpleNamespace(getoption=lambda name, default=None: True)
+        plugin = PytestStrategyPlugin()
+
+        plugin.pytest_collection_modifyitems(config, [])
+        plugin.pytest_sessionfinish(SimpleNamespace(config=config), 0)
+
+        assert plugin.passed_vectors is None
+
+    def test_session_without_cache_does_not_persist(self):
+        """Test that recorded vectors are not written when the cache is unavailable."""
+        plugin = PytestStrategyPlugin()
+        plugin.passed_vectors = {"key"}
+
+        plugin.pytest_sessionfinish(SimpleNamespace(config=SimpleNamespace()), 0)
+
+    @staticmethod
+    def _report(when, outcome, nodeid="test_x.py::test_v[x=1]"):
+        return SimpleNamespace(
+            nodeid=nodeid, when=when,
+            passed=outcome == "passed", failed=outcome == "failed",
+        )
+
+    def _plugin(self):
+        plugin = PytestStrategyPlugin()
+        plugin.passed_vectors = set()
+        plugin._vector_cache_keys["test_x.py::test_v[x=1]"] = "key"
+        return plugin
+
+    def test_vector_passes_after_clean_teardown(self):
+        """Test that a vector is recorded once setup, call and teardown pass."""
+        plugin = self._plugin()
+        for when in ("setup", "call"):
+            plugin.pytest_runtest_logreport(self._report(when, "passed"))
+            assert plugin.passed_vectors == set()
+
+        plugin.pytest_runtest_logreport(self._report("teardown", "passed"))
+        assert plugin.passed_vectors == {"key"}
+
+    def test_failed_teardown_is_not_recorded(self):
+        """Test that a passing call followed by a failing teardown is not cached."""
+        plugin = self._plugin()
+        plugin.passed_vectors.add("key")
+        plugin.pytest_runtest_logreport(self._report("setup", "passed"))
+        plugin.pytest_runtest_logreport(self._report("call", "passed"))
+        plugin.pytest_runtest_logreport(self._report("teardown", "failed"))
+
+        assert plugin.passed_vectors == set()
+
+    def test_failed_setup_discards_vector(self):
+        """Test that an error in setup drops a previously passed vector."""
+        plugin = self._plugin()
+        plugin.passed_vectors.add("key")
+        plugin.pytest_runtest_logreport(self._report("setup", "failed"))
+        plugin.pytest_runtest_logreport(self._report("teardown", "passed"))
+
+        assert plugin.passed_vectors == set()
+
+    def test_skipped_vector_is_kept(self):
+        """Test that a vector skipped by the cache stays recorded."""
+        plugin = self._plugin()
+        plugin.passed_vectors.add("key")
+        plugin.pytest_runtest_logreport(self._report("setup", "skipped"))
+        plugin.pytest_runtest_logreport(self._report("teardown", "passed"))
+
+        assert plugin.passed_vectors == {"key"}
+
+    def test_cache_keeps_only_collected_vectors(self):
+        """Test that keys of vectors not collected this session are dropped from the cache."""
+        stored = {}
+        cache = SimpleNamespace(
+            get=lambda key, default: ["kept", "stale"],
+            set=stored.__setitem__,
+        )
+        config = SimpleNamespace(getoption=lambda name, default=None: True, cache=cache)
+        markers = []
+        items = [SimpleNamespace(key="kept", add_marker=markers.append),
+                 SimpleNamespace(key="new", add_marker=markers.append)]
+        plugin = PytestStrategyPlugin()
+        plugin._vector_cache_key = lambda item: item.key
+
+        plugin.pytest_collection_modifyitems(config, items)
+        plugin.pytest_sessionfinish(SimpleNamespace(config=config), 0)
+
+        assert len(markers) == 1
+        assert stored == {PASSED_VECTORS_CACHE_KEY: ["kept"]}
+
+
+# ============================================================================
+# INI OPTION TESTS
+# ============================================================================
+
+class TestIniOptions:
+    """Test validation of the plugin's ini options."""
+
+    def test_invalid_max_scan_bytes_is_usage_error(self, tmp_path):
+        """Test that a non-integer strategies_max_scan_bytes names the option in a usage error."""
+        ini = {
+            "strategies_paths": [],
+            "testpaths": [],
+            "strategies_exclude_dirs": [],
+            "strategies_max_scan_bytes": "2MB",
+        }
+        config = SimpleNamespace(rootpath=tmp_path, getini=ini.__getitem__)
+
+        with pytest.raises(pytest.UsageError, match="strategies_max_scan_bytes"):
+            PytestStrategyPlugin().pytest_sessionstart(SimpleNamespace(config=config))
@@ -182,6 +182,21 @@ class TestRNGEnumPredicate:
         with pytest.raises(RNGValueError, match="No valid value found"):
             rng_enum.generate()
 
+    def test_predicate_evaluated_once_per_member(self):
+        """Test that the predicate is applied at construction, not per draw"""
+        calls = []
+
+        def predicate(s):
+            calls.append(s)
+            return s != Status.ERROR
+
+        RNG.seed(42)
+        rng_enum = RNGEnum(Status, predicate=predicate)
+        samples = [rng_enum.generate() for _ in range(50)]
+
+        assert len(calls) == len(Status)
+        assert Status.ERROR not in samples
+
 
 class TestRNGEnumWeightedWithPredicate:
     """Test combined weighted selection and predicate filtering"""
@@ -232,6 +247,158 @@ class TestRNGEnumWeightedWithPredicate:
         assert Status.ERROR not in samples
         assert set(samples).issubset({Status.SUCCESS, Status.FAILED})
 
+    def test_weighted_predicate_rejecting_all_raises_error(self):
+        """Test that a predicate rejecting every weighted member raises error"""
+        rng_enum = RNGEnum(
+            Status,
+            weights={Status.SUCCESS: 0.5, Status.FAILED: 0.5},
+            predicate=lambda s: s == Status.ERROR
+        )
+
+        with pytest.raises(RNGValueError, match="No valid value found"):
+            rng_enum.generate()
+
+    def test_weighted_distribution_matches_weights(self):
+        """Test that alias-table sampling follows the requested weights"""
+        RNG.seed(42)
+        rng_enum = RNGEnum(Priority, weights={
+            Priority.LOW: 1,
+            Priority.MEDIUM: 2,
+            Priority.HIGH: 3,
+            Priority.CRITICAL: 4
+        })
+
+        samples = [rng_enum.generate() for _ in range(10000)]
+
+        # Each member should land within a few percent of its share
+        for member, weight in rng_enum.weights.items():
+            assert abs(samples.count(member) / 10000 - weight / 10) < 0.03
+
+    def test_zero_weight_member_never_selected(self):
+        """Test that members with zero weight are never selected"""
+        RNG.seed(42)
+        rng_enum = RNGEnum(Status, weights={
+            Status.SUCCESS: 1.0,
+            Status.FAILED: 0.0
+        })
+
+        samples = [rng_enum.generate() for _ in range(100)]
+        assert set(samples) == {Status.SUCCESS}
+
+
+class TestRNGEnumSetWeights:
+    """Test replacing weights after construction"""
+
+    def test_set_weights_rebuilds_table(self):
+        """Test that new weights take effect immediately"""
+        RNG.seed(42)
+        rng_enum = RNGEnum(Status, weights={Status.SUCCESS: 1.0})
+        rng_enum.set_weights({Status.FAILED: 1.0})
+
+        samples = [rng_enum.generate() for _ in range(20)]
+        assert set(samples) == {Status.FAILED}
+
+    def test_set_weights_none_switches_to_uniform(self):
+        """Test that clearing weights falls back to uniform selection"""
+        RNG.seed(42)
+        rng_enum = RNGEnum(
+            Status,
+            weights={Status.SUCCESS: 1.0},
+            predicate=lambda s: s != Status.ERROR
+        )
+        rng_enum.set_weights(None)
+
+        samples = [rng_enum.generate() for _ in range(100)]
+        assert rng_enum.weights is None
+        assert set(samples) == {Status.PENDING, Status.SUCCESS, Status.FAILED}
+
+    def test_set_weights_invalid_member_raises_error(self):
+        """Test that invalid members are rejected and old weights kept"""
+        rng_enum = RNGEnum(Status, weights={Status.SUCCESS: 1.0})
+
+        with pytest.raises(RNGValueError, match="is not a member of"):
+            rng_enum.set_weights({Priority.HIGH: 1.0})
+        assert rng_enum.weights == {Status.SUCCESS: 1.0}
+
+    def test_assigning_weights_on_uniform_enum(self):
+        """Test that assigning weights to a uniform enum switches to weighted draws"""
+        rng_enum = RNGEnum(Status)
+        rng_enum.weights = {Status.PENDING: 1.0}
+
+        assert {rng_enum.generate() for _ in range(20)} == {Status.PENDING}
+        assert rng_enum.generate_batch(5) == [Status.PENDING] * 5
+
+    def test_assigning_none_weights(self):
+        """Test that assigning None falls back to uniform selection"""
+        RNG.seed(42)
+        rng_enum = RNGEnum(Status, weights={Status.SUCCESS: 1.0})
+        rng_enum.weights = None
+
+        assert rng_enum.weights is None
+        assert {rng_enum.generate() for _ in range(200)} == set(Status)
+
+    def test_assigning_invalid_weights_raises_error(self):
+        """Test that assigned weights are validated like set_weights()"""
+        rng_enum = RNGEnum(Status)
+        with pytest.raises(RNGValueError, match="is not a member of"):
+            rng_enum.weights = {Priority.HIGH: 1.0}
+
+    def test_weights_edited_in_place(self):
+        """Test that in-place edits to the weights dict take effect on the next draw"""
+        weights = {Status.SUCCESS: 1.0}
+        rng_enum = RNGEnum(Status, weights=weights)
+        rng_enum.generate()
+
+        del weights[Status.SUCCESS]
+        weights[Status.FAILED] = 1.0
+        assert {rng_enum.generate() for _ in range(20)} == {Status.FAILED}
+        assert rng_enum.domain == [Status.FAILED]
+
+    def test_assigning_predicate(self):
+        """Test that assigning a predicate rebuilds uniform and weighted pools"""
+        uniform = RNGEnum(Status)
+        uniform.predicate = lambda s: s == Status.ERROR
+        assert {uniform.generate() for _ in range(20)} == {Status.ERROR}
+
+        weighted = RNGEnum(Status, weights={Status.SUCCESS: 1.0, Status.FAILED: 1.0})
+        weighted.predicate = lambda s: s != Status.SUCCESS
+        assert set(weighted.generate_batch(20)) == {Status.FAILED}
+
+
+class TestRNGEnumBatch:
+    """Test batch generation"""
+
+    def test_uniform_batch(self):
+        """Test uniform batch covers the filtered pool"""
+        RNG.seed(42)
+        rng_enum = RNGEnum(Status, predicate=lambda s: s != Status.ERROR)
+
+        samples = rng_enum.generate_batch(100)
+
+        assert len(samples) == 100
+        assert set(samples) == {Status.PENDING, Status.SUCCESS, Status.FAILED}
+
+    def test_weighted_batch(self):
+        """Test weighted batch respects weights and predicate"""
+        RNG.seed(42)
+        rng_enum = RNGEnum(
+            Priority,
+            weights={Priority.HIGH: 0.6, Priority.MEDIUM: 0.3, Priority.LOW: 0.1},
+            predicate=lambda p: p != Priority.LOW
+        )
+
+        samples = rng_enum.generate_batch(200)
+
+        assert set(samples) == {Priority.HIGH, Priority.MEDIUM}
+        assert samples.count(Priority.HIGH) > samples.count(Priority.MEDIUM)
+
+    def test_batch_impossible_predicate_raises_error(self):
+        """Test batch generation with an empty pool raises error"""
+        rng_enum = RNGEnum(Status, predicate=lambda s: False)
+
+        with pytest.raises(RNGValueError, match="No valid value found"):
+            rng_enum.generate_batch(5)
+
 
 class TestRNGEnumReproducibility:
     """Test seed-based reproducibility"""
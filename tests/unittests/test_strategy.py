@@ -0,0 +1,496 @@
+"""
+Unit tests for Strategy module.
+
+Tests the Strategy registry and decorator internals: factory invocation,
+signature validation, dataclass conversion and test ID generation.
+"""
+
+import inspect
+
+import pytest
+
+from pytest_strategy import Parameter, RNGInteger, Strategy, TestArg
+
+
+def _parametrize_mark(test_fn):
+    """Return the parametrize mark applied by Strategy.strategy."""
+    return next(m for m in test_fn.pytestmark if m.name == "parametrize")
+
+
+# ============================================================================
+# FACTORY INVOCATION TESTS
+# ============================================================================
+
+class TestStrategyFactory:
+    """Test how registered factories are called."""
+
+    def test_factory_output_is_cached(self):
+        """Test that the factory runs once for repeated decorations."""
+        calls = []
+
+        @Strategy.register("unit_cached_factory")
+        def factory(nsamples):
+            calls.append(nsamples)
+            return Parameter(TestArg("x", rng_type=RNGInteger(0, 10)))
+
+        @Strategy.strategy("unit_cached_factory")
+        def first(x):
+            pass
+
+        @Strategy.strategy("unit_cached_factory")
+        def second(x):
+            pass
+
+        assert len(calls) == 1
+        assert _parametrize_mark(first).args == _parametrize_mark(second).args
+
+    def test_reregistering_invalidates_cache(self):
+        """Test that re-registering a name drops the cached output."""
+        @Strategy.register("unit_reregistered")
+        def old_factory(nsamples):
+            return ("x",), [(1,)]
+
+        @Strategy.strategy("unit_reregistered")
+        def first(x):
+            pass
+
+        @Strategy.register("unit_reregistered")
+        def new_factory(nsamples):
+            return ("x",), [(2,)]
+
+        @Strategy.strategy("unit_reregistered")
+        def second(x):
+            pass
+
+        assert list(_parametrize_mark(first).args[1]) == [1]
+        assert list(_parametrize_mark(second).args[1]) == [2]
+
+    def test_tuple_strategy_ids_are_built_once(self, monkeypatch):
+        """Test that repeated decorations with a tuple strategy reuse their test IDs."""
+        @Strategy.register("unit_shared_ids")
+        def factory(nsamples):
+            return "x", [(1,), (2,)]
+
+        calls = []
+        unwrap_single_samples = Strategy._unwrap_single_samples
+        monkeypatch.setattr(
+            Strategy, "_unwrap_single_samples",
+            staticmethod(lambda *args: calls.append(args) or unwrap_single_samples(*args))
+        )
+
+        @Strategy.strategy("unit_shared_ids")
+        def first(x):
+            pass
+
+        @Strategy.strategy("unit_shared_ids")
+        def second(x):
+            pass
+
+        assert len(calls) == 1
+        assert _parametrize_mark(first).kwargs["ids"] == ["x=1", "x=2"]
+        assert _parametrize_mark(second).kwargs["ids"] == ["x=1", "x=2"]
+
+    def test_strategies_draw_independent_samples(self):
+        """Test that identically defined strategies don't replay the same values."""
+        for name in ("unit_stream_a", "unit_stream_b"):
+            Strategy.register(name)(
+                lambda nsamples: Parameter(TestArg("x", rng_type=RNGInteger(0, 10**9)))
+            )
+
+        @Strategy.strategy("unit_stream_a")
+        def first(x):
+            pass
+
+        @Strategy.strategy("unit_stream_b")
+        def second(x):
+            pass
+
+        assert _parametrize_mark(first).args[1] != _parametrize_mark(second).args[1]
+
+    def test_cached_tuple_strategy_is_not_reseeded(self, monkeypatch):
+        """Test that reusing cached tuple output skips the random stream restart."""
+        from pytest_strategy import RNG
+
+        @Strategy.register("unit_no_reseed")
+        def factory(nsamples):
+            return "x", [(1,)]
+
+        calls = []
+        refresh_seed = RNG.refresh_seed
+        monkeypatch.setattr(
+            RNG, "refresh_seed",
+            staticmethod(lambda *args, **kwargs: calls.append(kwargs) or refresh_seed(*args, **kwargs))
+        )
+
+        @Strategy.strategy("unit_no_reseed")
+        def first(x):
+            pass
+
+        @Strategy.strategy("unit_no_reseed")
+        def second(x):
+            pass
+
+        assert calls == [{"stream": "unit_no_reseed"}]
+
+    def test_cached_parameter_strategy_is_reseeded_once(self, monkeypatch):
+        """Test that reusing drawn Parameter samples skips the random stream restart."""
+        from pytest_strategy import RNG
+
+        Strategy.register("unit_param_no_reseed")(
+            lambda nsamples: Parameter(TestArg("x", rng_type=RNGInteger(0, 10**9)))
+        )
+
+        calls = []
+        refresh_seed = RNG.refresh_seed
+        monkeypatch.setattr(
+            RNG, "refresh_seed",
+            staticmethod(lambda *args, **kwargs: calls.append(kwargs) or refresh_seed(*args, **kwargs))
+        )
+
+        @Strategy.strategy("unit_param_no_reseed")
+        def first(x):
+            pass
+
+        @Strategy.strategy("unit_param_no_reseed")
+        def second(x):
+            pass
+
+        assert calls == [{"stream": "unit_param_no_reseed"}]
+        assert _parametrize_mark(first).args[1] == _parametrize_mark(second).args[1]
+
+    def test_positional_factory_is_called_positionally(self):
+        """Test that a factory with another parameter name gets nsamples positionally."""
+        calls = []
+
+        @Strategy.register("unit_positional_factory")
+        def factory(n):
+            calls.append(n)
+            return "x", [(n,)]
+
+        @Strategy.strategy("unit_positional_factory")
+        def test_fn(x):
+            pass
+
+        assert len(calls) == 1
+
+    def test_keyword_only_factory(self):
+        """Test that a keyword-only nsamples parameter is supported."""
+        @Strategy.register("unit_keyword_only_factory")
+        def factory(*, nsamples):
+            return "x", [(nsamples,)]
+
+        @Strategy.strategy("unit_keyword_only_factory")
+        def test_fn(x):
+            pass
+
+        assert len(list(_parametrize_mark(test_fn).args[1])) == 1
+
+    def test_factory_type_error_is_not_retried(self):
+        """Test that a TypeError raised inside the factory body is reported once."""
+        calls = []
+
+        @Strategy.register("unit_failing_factory")
+        def factory(nsamples):
+            calls.append(nsamples)
+            raise TypeError("bad operand")
+
+        with pytest.raises(ValueError, match="bad operand"):
+            @Strategy.strategy("unit_failing_factory")
+            def test_fn(x):
+                pass
+
+        assert len(calls) == 1
+
+    def test_test_function_signature_read_once(self, monkeypatch):
+        """Test that decorating a wrapped test inspects its signature only once."""
+        import functools
+
+        @Strategy.register("unit_signature_once")
+        def factory(nsamples):
+            return ("x", "y"), [(1, 2)]
+
+        def inner(x, y):
+            pass
+
+        @functools.wraps(inner)
+        def test_fn(*args, **kwargs):
+            pass
+
+        calls = []
+        signature = inspect.signature
+        monkeypatch.setattr(
+            inspect, "signature",
+            lambda fn, *args, **kwargs: calls.append(fn) or signature(fn, *args, **kwargs)
+        )
+        Strategy.strategy("unit_signature_once")(test_fn)
+        Strategy.strategy("unit_signature_once")(test_fn)
+
+        assert calls.count(test_fn) == 1
+
+    def test_plain_test_function_is_read_from_code(self, monkeypatch):
+        """Test that plain test functions don't go through inspect.signature."""
+        @Strategy.register("unit_signature_from_code")
+        def factory(nsamples):
+            return ("x", "y"), [(1, 2)]
+
+        def test_fn(request, x, y):
+            pass
+
+        monkeypatch.setattr(inspect, "signature", lambda *args, **kwargs: pytest.fail("inspected"))
+        Strategy.strategy("unit_signature_from_code")(test_fn)
+
+        assert list(_parametrize_mark(test_fn).args[1]) == [(1, 2)]
+
+    def test_code_parameters_match_signature(self):
+        """Test that parameters read from the code object follow signature order."""
+        def test_fn(a, /, b: int, *rest, c, d=1, **extra):
+            pass
+
+        params, annotations = Strategy._test_parameters(test_fn)
+        assert params == tuple(inspect.signature(test_fn).parameters)
+        assert annotations == {"b": int}
+
+    def test_test_parameters_leave_function_untouched(self):
+        """Test that inspecting a test function caches without setting attributes on it."""
+        def test_fn(x, y):
+            pass
+
+        before = dict(vars(test_fn))
+        assert Strategy._test_parameters(test_fn) is Strategy._test_parameters(test_fn)
+        assert vars(test_fn) == before
+
+    def test_invalid_factory_output_raises(self):
+        """Test that a factory returning neither Parameter nor a pair is rejected."""
+        @Strategy.register("unit_invalid_output")
+        def factory(nsamples):
+            return [1, 2, 3]
+
+        with pytest.raises(ValueError, match="must return either a Parameter"):
+            @Strategy.strategy("unit_invalid_output")
+            def test_fn(x):
+                pass
+
+
+# ============================================================================
+# SIGNATURE VALIDATION TESTS
+# ============================================================================
+
+class TestSignatureValidation:
+    """Test the check of test function parameters against strategy argnames."""
+
+    def test_fixtures_are_ignored(self):
+        """Test that known and custom fixtures don't count as mismatches."""
+        def test_fn(tmp_path, x, my_fixture, y):
+            pass
+
+        Strategy._validate_signature(test_fn, ("y", "x"), "unit_fixtures")
+
+    def test_missing_parameter_raises(self):
+        """Test that a strategy argname absent from the test is reported."""
+        def test_fn(request, x):
+            pass
+
+        with pytest.raises(ValueError, match="Missing parameters: \\['y'\\]"):
+            Strategy._validate_signature(test_fn, ("x", "y"), "unit_missing")
+
+    def test_fixture_named_argname_still_raises(self):
+        """Test that an argname shadowing a known fixture is reported even in order."""
+        def test_fn(x, request):
+            pass
+
+        with pytest.raises(ValueError, match="Missing parameters: \\['request'\\]"):
+            Strategy._validate_signature(test_fn, ("x", "request"), "unit_fixture_argname")
+
+    def test_argnames_meta_is_shared(self):
+        """Test that the argstr and name set are built once per argnames."""
+        meta = Strategy._argnames_meta(("unit_a", "unit_b"))
+        assert meta == ("unit_a,unit_b", frozenset({"unit_a", "unit_b"}))
+        assert Strategy._argnames_meta(("unit_a", "unit_b")) is meta
+
+    def test_fixture_set_is_immutable(self):
+        """Test that the known fixture names are a frozenset."""
+        assert isinstance(Strategy.PYTEST_FIXTURES, frozenset)
+        assert "monkeypatch" in Strategy.PYTEST_FIXTURES
+
+
+# ============================================================================
+# TEST ID TESTS
+# ============================================================================
+
+class TestStrategyTestIds:
+    """Test the test IDs built from sample values."""
+
+    def test_single_parameter_ids(self):
+        """Test that single-parameter IDs are name=repr(value)."""
+        assert Strategy._generate_test_ids(("x",), [1, "a", None]) == ["x=1", "x='a'", "x=None"]
+
+    def test_single_parameter_id_is_truncated(self):
+        """Test that long single values are cut to max_length."""
+        ids = Strategy._generate_test_ids(("x",), ["a" * 200])
+        assert len(ids[0]) == 80
+        assert ids[0].startswith("x='aaa") and ids[0].endswith("...")
+
+    def test_single_parameter_samples_unwrapped_with_ids(self):
+        """Test that 1-tuples are unwrapped alongside their IDs."""
+        values, ids = Strategy._unwrap_single_samples("x", [(1,), 2, ((3, 4),)])
+        assert values == [1, 2, (3, 4)]
+        assert ids == ["x=1", "x=2", "x=(3, 4)"]
+
+    def test_multiple_parameter_ids(self):
+        """Test that multi-parameter IDs join name=value pairs with commas."""
+        ids = Strategy._generate_test_ids(("x", "y"), [(1, 2.5), ("b" * 30, None)])
+        assert ids == ["x=1,y=2.5", "x='bbbbbbbbbbbbbbbb...,y=None"]
+
+    def test_short_then_long_multiple_parameter_ids(self):
+        """Test that IDs stay per-value truncated once samples outgrow the short format."""
+        ids = Strategy._generate_test_ids(("x", "y"), [(1, 2), ("c" * 30, 3), (4, 5)])
+        assert ids == ["x=1,y=2", "x='cccccccccccccccc...,y=3", "x=4,y=5"]
+
+    def test_multiple_parameter_id_is_truncated(self):
+        """Test that the joined ID is cut to max_length."""
+        ids = Strategy._generate_test_ids(tuple("abcde"), [tuple("z" * 19 for _ in range(5))])
+        assert len(ids[0]) == 80
+        assert ids[0].endswith("...")
+
+    def test_longest_possible_id_is_not_truncated(self):
+        """Test that an ID exactly at the length bound is kept whole."""
+        argnames = ("a" * 19, "b" * 19)
+        ids = Strategy._generate_test_ids(argnames, [("x" * 30, "y" * 30)], max_length=81)
+        assert Strategy._max_id_length([f"{n}=" for n in argnames]) == 81
+        assert ids == [f"{'a' * 19}='{'x' * 16}...,{'b' * 19}='{'y' * 16}..."]
+
+
+# ============================================================================
+# COLUMN-WISE SAMPLE TESTS
+# ============================================================================
+
+class TestColumnSamples:
+    """Test tuple strategies returning samples as {argname: values} columns."""
+
+    def test_columns_match_row_samples(self):
+        """Test that columns parametrize the same as the equivalent rows."""
+        @Strategy.register("unit_columns")
+        def factory(nsamples):
+            return ("x", "y"), {"y": [2, 4], "x": [1, 3]}
+
+        @Strategy.strategy("unit_columns")
+        def test_fn(x, y):
+            pass
+
+        assert list(_parametrize_mark(test_fn).args[1]) == [(1, 2), (3, 4)]
+
+    def test_single_column_is_unwrapped(self):
+        """Test that a single column gives plain values, not 1-tuples."""
+        @Strategy.register("unit_single_column")
+        def factory(nsamples):
+            return "x", {"x": [5, 6]}
+
+        @Strategy.strategy("unit_single_column")
+        def test_fn(x):
+            pass
+
+        assert list(_parametrize_mark(test_fn).args[1]) == [5, 6]
+
+    def test_mismatched_columns_raise(self):
+        """Test that columns not matching argnames are rejected."""
+        @Strategy.register("unit_bad_columns")
+        def factory(nsamples):
+            return ("x", "y"), {"x": [1], "z": [2]}
+
+        with pytest.raises(ValueError, match="don't match argnames"):
+            @Strategy.strategy("unit_bad_columns")
+            def test_fn(x, y):
+                pass
+
+    def test_uneven_columns_raise(self):
+        """Test that columns of different lengths are rejected."""
+        @Strategy.register("unit_uneven_columns")
+        def factory(nsamples):
+            return ("x", "y"), {"x": [1, 2], "y": [3]}
+
+        with pytest.raises(ValueError, match="different lengths"):
+            @Strategy.strategy("unit_uneven_columns")
+            def test_fn(x, y):
+                pass
+
+
+# ============================================================================
+# DATACLASS TESTS
+# ============================================================================
+
+class TestDataclassConversion:
+    """Test conversion of samples into dataclass instances."""
+
+    def test_field_names_are_cached_per_class(self, monkeypatch):
+        """Test that a dataclass's fields are read once across conversions and IDs."""
+        from dataclasses import dataclass
+
+        import pytest_strategy.strategy as strategy_module
+
+        @dataclass
+        class Point:
+            x: int
+            y: int
+
+        calls = []
+        dc_fields = strategy_module.fields
+        monkeypatch.setattr(
+            strategy_module, "fields",
+            lambda tp: calls.append(tp) or dc_fields(tp)
+        )
+        points = Strategy._convert_to_dataclass([(2, 1), (4, 3)], ("y", "x"), Point)
+        ids = Strategy._generate_dataclass_ids(points, Point)
+
+        assert points == [Point(1, 2), Point(3, 4)]
+        assert ids == ["x=1,y=2", "x=3,y=4"]
+        assert calls.count(Point) == 1
+
+    def test_constructor_is_generated_once(self):
+        """Test that conversions for the same dataclass and argnames reuse one constructor."""
+        from dataclasses import dataclass
+
+        @dataclass
+        class Pair:
+            a: str
+            b: int
+
+        Strategy._convert_to_dataclass([(1, "x")], ("b", "a"), Pair)
+        build = Strategy._dataclass_builders[(Pair, ("b", "a"))]
+
+        assert Strategy._convert_to_dataclass([(2, "y")], ["b", "a"], Pair) == [Pair("y", 2)]
+        assert Strategy._dataclass_builders[(Pair, ("b", "a"))] is build
+
+    def test_mismatched_fields_raise(self):
+        """Test that argnames not matching the dataclass fields are rejected."""
+        from dataclasses import dataclass
+
+        @dataclass
+        class Pair:
+            a: str
+            b: int
+
+        with pytest.raises(ValueError, match="Missing in dataclass: \\['c'\\]"):
+            Strategy._convert_to_dataclass([(1, "x")], ("c", "a"), Pair)
+
+    def test_dataclass_mode_reports_parameter_name(self):
+        """Test that dataclass mode detection returns the dataclass parameter."""
+        from dataclasses import dataclass
+
+        @dataclass
+        class Pair:
+            a: str
+            b: int
+
+        def test_fn(request, pair: Pair):
+            pass
+
+        assert Strategy._is_dataclass_mode(test_fn, ("a", "b")) == (True, Pair, "pair")
+        assert Strategy._is_dataclass_mode(test_fn, ("a",)) == (False, None, None)
+
+    def test_single_argname_skips_signature(self, monkeypatch):
+        """Test that dataclass detection doesn't inspect tests for single-argname strategies."""
+        def test_fn(x):
+            pass
+
+        monkeypatch.setattr(inspect, "signature", lambda *args, **kwargs: pytest.fail("inspected"))
+        assert Strategy._is_dataclass_mode(test_fn, ("x",)) == (False, None, None)
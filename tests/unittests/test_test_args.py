@@ -173,6 +173,58 @@ class TestTestArgGeneration:
         assert samples == []
 
 
+    def test_generate_batch_random(self):
+        """Test generating a batch of random values."""
+        arg = TestArg("count", rng_type=RNGInteger(0, 100))
+        values = arg.generate_batch(20)
+        assert len(values) == 20
+        assert all(0 <= v <= 100 for v in values)
+
+    def test_generate_batch_static_value(self):
+        """Test that a batch of a static value repeats it."""
+        arg = TestArg("count", value=42)
+        assert arg.generate_batch(3) == [42, 42, 42]
+
+    def test_generate_batch_validation_fails(self):
+        """Test that batch values are validated."""
+        arg = TestArg(
+            "count",
+            rng_type=RNGInteger(0, 10),
+            validator=lambda x: x > 100
+        )
+        with pytest.raises(ValueError, match="failed validation"):
+            arg.generate_batch(5)
+
+    def test_generate_batch_without_rng_type_raises_error(self):
+        """Test that generate_batch raises error without rng_type."""
+        arg = TestArg("count", directed_values=[1, 2, 3])
+        with pytest.raises(ValueError, match="Cannot generate value"):
+            arg.generate_batch(5)
+
+    def test_generate_samples_draws_one_batch(self, monkeypatch):
+        """Test that random samples come from a single batch draw."""
+        arg = TestArg("count", rng_type=RNGInteger(0, 100), directed_values=[-1])
+        calls = []
+        monkeypatch.setattr(
+            RNGInteger, "generate_batch",
+            lambda self, n: calls.append(n) or [7] * n
+        )
+        assert arg.generate_samples(4) == [-1, 7, 7, 7, 7]
+        assert calls == [4]
+
+    def test_generate_samples_follows_rng_type_changes(self):
+        """Test that changing the RNG type's range between calls takes effect."""
+        from pytest_strategy import RNG
+
+        arg = TestArg("count", rng_type=RNGInteger(1, 10))
+        RNG.seed(1234)
+        arg.generate_samples(5)
+        arg.rng_type.min, arg.rng_type.max = 500, 1000
+
+        RNG.seed(1234)
+        assert all(500 <= v <= 1000 for v in arg.generate_samples(5))
+
+
 # ============================================================================
 # VALIDATION TESTS
 # ============================================================================
@@ -214,6 +266,19 @@ class TestTestArgValidation:
         arg = TestArg("count", value=-100)
         assert arg.generate() == -100
 
+    def test_random_value_validated_on_each_call(self):
+        """Test that random values are validated every time they are generated."""
+        seen = []
+        arg = TestArg(
+            "count",
+            rng_type=RNGInteger(0, 10),
+            validator=lambda x: seen.append(x) or len(seen) < 3
+        )
+        arg.generate()
+        arg.generate()
+        with pytest.raises(ValueError, match="failed validation for argument 'count'"):
+            arg.generate()
+
 
 # ============================================================================
 # PROPERTY TESTS
@@ -328,6 +393,13 @@ class TestTestArgStringRepresentation:
 class TestTestArgEdgeCases:
     """Test edge cases and error handling."""
 
+    def test_no_instance_dict(self):
+        """Test that TestArg keeps its state in slots, not a __dict__."""
+        arg = TestArg("count", rng_type=RNGInteger(0, 100))
+        assert not hasattr(arg, "__dict__")
+        with pytest.raises(AttributeError):
+            arg.extra = 1
+
     def test_empty_directed_values_list(self):
         """Test with empty directed values list."""
         arg = TestArg("count", rng_type=RNGInteger(0, 100), directed_values=[])